@@ -1,21 +1,26 @@
 """
 Defines all REST API routes following FastAPI best practices.
 """
-from fastapi import APIRouter, HTTPException, status, Query, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter, HTTPException, status, Query, Depends, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+from pydantic import ValidationError
 
 from swen_ai_pipeline.models.data_models import (
     RawNewsInput,
     FinalNewsOutput,
-    NewsSummary,
     NewsListResponse,
-    IngestionResponse
+    IngestionResponse,
+    BatchIngestionResponse,
+    FINAL_NEWS_ADAPTER,
+    NEWS_LIST_ADAPTER,
+    RAW_NEWS_BATCH_ADAPTER
 )
 from swen_ai_pipeline.services.ingestion_service import get_ingestion_service, IngestionService
-from swen_ai_pipeline.db.database import get_db
+from swen_ai_pipeline.core.config import Settings, get_settings
 
 
-# Create API router
+# Create API router (responses use the app-wide ORJSONResponse set in main.py)
 router = APIRouter()
 
 
@@ -28,11 +33,18 @@ router = APIRouter()
     description="Triggers the AI enrichment pipeline for a raw news article. "
                 "Returns the fully enriched article with AI-generated metadata, "
                 "media URLs, and contextual information.",
-    tags=["News Ingestion"]
+    tags=["News Ingestion"],
+    # The body is parsed by hand below, so document it explicitly
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": RawNewsInput.model_json_schema()}}
+        }
+    }
 )
 async def ingest_news(
-    raw_input: RawNewsInput,
-    db: AsyncSession = Depends(get_db)
+    request: Request,
+    service: IngestionService = Depends(get_ingestion_service)
 ) -> IngestionResponse:
     """
     POST /api/v1/ingest - Ingest and enrich a news article.
@@ -44,47 +56,111 @@ async def ingest_news(
     4. Returns the complete enriched article
     
     Args:
-        raw_input: Raw news article data (title, body, source_url, etc.)
+        request: Request whose JSON body is the raw news article
+            (title, body, source_url, etc.)
         
     Returns:
         IngestionResponse containing status and enriched article data
         
     Raises:
-        HTTPException 500: If ingestion pipeline fails
+        RequestValidationError: If the body is not a valid RawNewsInput (422)
     """
+    # Validate the raw bytes directly in pydantic-core, skipping json.loads
     try:
-        # Create ingestion service with database session
-        service = get_ingestion_service(db)
+        raw_input = RawNewsInput.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
+    # Process through ingestion service; unexpected failures reach the
+    # application-wide exception handler
+    enriched_news = await service.ingest_news(raw_input)
+    
+    return IngestionResponse(
+        status="success",
+        message="News article successfully ingested and enriched",
+        id=enriched_news.id,
+        data=enriched_news
+    )
+
+
+@router.post(
+    "/ingest/batch",
+    response_model=BatchIngestionResponse,
+    response_model_exclude_none=True,
+    status_code=status.HTTP_201_CREATED,
+    summary="Ingest and enrich several news articles",
+    description="Runs the AI enrichment pipeline for a list of raw news articles "
+                "concurrently. Returns the enriched articles in input order.",
+    tags=["News Ingestion"],
+    # The body is parsed by hand below, so document it explicitly. The item
+    # schema is inlined like /ingest's: RawNewsInput isn't in the document's
+    # components, and a standalone schema's "#/$defs/..." refs wouldn't resolve
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {
+                "type": "array",
+                "items": RawNewsInput.model_json_schema()
+            }}}
+        }
+    }
+)
+async def ingest_news_batch(
+    request: Request,
+    service: IngestionService = Depends(get_ingestion_service),
+    settings: Settings = Depends(get_settings)
+) -> BatchIngestionResponse:
+    """
+    POST /api/v1/ingest/batch - Ingest and enrich several news articles.
+    
+    Args:
+        request: Request whose JSON body is a list of raw news articles
         
-        # Process through ingestion service
-        enriched_news = await service.ingest_news(raw_input)
+    Returns:
+        BatchIngestionResponse containing the ids and enriched articles
         
-        return IngestionResponse(
-            status="success",
-            message="News article successfully ingested and enriched",
-            id=enriched_news.id,
-            data=enriched_news
+    Raises:
+        RequestValidationError: If the body is not a list of RawNewsInput (422)
+        HTTPException 413: If the list exceeds settings.ingest_batch_max_size
+    """
+    try:
+        raw_inputs = RAW_NEWS_BATCH_ADAPTER.validate_json(await request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
         )
-        
-    except Exception as e:
+    
+    if len(raw_inputs) > settings.ingest_batch_max_size:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to ingest news article: {str(e)}"
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch size {len(raw_inputs)} exceeds the limit of {settings.ingest_batch_max_size}"
         )
+    
+    enriched_news = await service.ingest_news_batch(raw_inputs)
+    
+    return BatchIngestionResponse(
+        status="success",
+        message=f"{len(enriched_news)} news articles successfully ingested and enriched",
+        ids=[news.id for news in enriched_news],
+        data=enriched_news
+    )
 
 
 @router.get(
     "/news/{id}",
-    response_model=FinalNewsOutput,
-    response_model_exclude_none=True,
+    # Serialized by hand below; the model is kept for the OpenAPI schema only
+    response_model=None,
+    responses={200: {"model": FinalNewsOutput}},
     summary="Retrieve a news article by ID",
     description="Returns the complete enriched news article for the given UUID identifier.",
     tags=["News Retrieval"]
 )
 async def get_news_by_id(
     id: str,
-    db: AsyncSession = Depends(get_db)
-) -> FinalNewsOutput:
+    service: IngestionService = Depends(get_ingestion_service)
+) -> Response:
     """
     GET /api/v1/news/{id} - Retrieve a single news article.
     
@@ -92,12 +168,11 @@ async def get_news_by_id(
         id: Unique UUID identifier for the article
         
     Returns:
-        Complete enriched news article
+        JSON response with the complete enriched news article
         
     Raises:
         HTTPException 404: If article not found
     """
-    service = get_ingestion_service(db)
     news = await service.get_news_by_id(id)
     
     if not news:
@@ -106,13 +181,19 @@ async def get_news_by_id(
             detail=f"News article with ID '{id}' not found"
         )
     
-    return news
+    # Repository output is already validated, so skip re-validation and
+    # serialize straight to JSON bytes
+    return Response(
+        content=FINAL_NEWS_ADAPTER.dump_json(news, by_alias=True, exclude_none=True),
+        media_type="application/json"
+    )
 
 
 @router.get(
     "/news",
-    response_model=NewsListResponse,
-    response_model_exclude_none=True,
+    # Serialized by hand below; the model is kept for the OpenAPI schema only
+    response_model=None,
+    responses={200: {"model": NewsListResponse}},
     summary="List all news articles",
     description="Returns a paginated list of news article summaries. "
                 "Includes essential fields like title, summary, tags, and relevance score.",
@@ -130,8 +211,8 @@ async def list_news(
         ge=0,
         description="Number of articles to skip"
     ),
-    db: AsyncSession = Depends(get_db)
-) -> NewsListResponse:
+    service: IngestionService = Depends(get_ingestion_service)
+) -> Response:
     """
     GET /api/v1/news - List all news articles with pagination.
     
@@ -140,40 +221,16 @@ async def list_news(
         offset: Number of articles to skip (default 0)
         
     Returns:
-        NewsListResponse with total count and list of article summaries
+        JSON response with the total count and list of article summaries
     """
-    try:
-        service = get_ingestion_service(db)
-        
-        # Get news articles and count
-        news_items = await service.get_all_news(limit=limit, offset=offset)
-        total_count = await service.get_news_count()
-        
-        # Convert to summary format
-        summaries = [
-            NewsSummary(
-                id=news.id,
-                title=news.title,
-                summary=news.summary,
-                tags=news.tags,
-                relevance_score=news.relevance_score,
-                published_at=news.published_at,
-                ingested_at=news.ingested_at,
-                featured_image_url=news.media.featured_image_url if news.media else None
-            )
-            for news in news_items
-        ]
-        
-        return NewsListResponse(
-            total=total_count,
-            items=summaries
-        )
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Failed to retrieve news list: {str(e)}"
-        )
+    # Get news summaries and total count in a single query
+    summaries, total_count = await service.get_all_news_summaries(limit=limit, offset=offset)
+    
+    response = NewsListResponse.model_construct(total=total_count, items=summaries)
+    return Response(
+        content=NEWS_LIST_ADAPTER.dump_json(response, by_alias=True, exclude_none=True),
+        media_type="application/json"
+    )
 
 
 @router.get(
@@ -182,7 +239,7 @@ async def list_news(
     description="Returns the health status of the API service.",
     tags=["System"]
 )
-async def health_check():
+async def health_check(settings: Settings = Depends(get_settings)):
     """
     GET /api/v1/health - Health check endpoint.
     
@@ -191,8 +248,8 @@ async def health_check():
     """
     return {
         "status": "healthy",
-        "service": "SWEN AI-Enriched News Pipeline",
-        "version": "1.0.0"
+        "service": settings.app_name,
+        "version": settings.app_version
     }
 
 
@@ -205,14 +262,13 @@ async def health_check():
     description="Returns statistics about the news pipeline.",
     tags=["System"]
 )
-async def get_stats(db: AsyncSession = Depends(get_db)):
+async def get_stats(service: IngestionService = Depends(get_ingestion_service)):
     """
     GET /api/v1/stats - Get pipeline statistics.
     
     Returns:
         Statistics about stored articles
     """
-    service = get_ingestion_service(db)
     total_count = await service.get_news_count()
     
     return {
@@ -1,7 +1,9 @@
 """
 Loads settings from environment variables with sensible defaults.
 """
-from typing import Optional, List
+import os
+from functools import lru_cache
+from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -37,6 +39,11 @@ class Settings(BaseSettings):
         default=8000,
         description="API port"
     )
+    workers: int = Field(
+        default_factory=lambda: os.cpu_count() or 1,
+        alias="WEB_CONCURRENCY",
+        description="Number of uvicorn worker processes (defaults to the CPU count)"
+    )
     
     # AI Service settings
     gemini_api_key: Optional[str] = Field(
@@ -51,6 +58,38 @@ class Settings(BaseSettings):
         default=True,
         description="Use mock AI service for development/testing"
     )
+    gemini_timeout: float = Field(
+        default=30.0,
+        description="Timeout for Gemini API requests (seconds)"
+    )
+    gemini_max_connections: int = Field(
+        default=32,
+        description="Maximum concurrent HTTP connections to the Gemini API"
+    )
+    gemini_concurrency: int = Field(
+        default=32,
+        description="Maximum Gemini requests in flight per worker; further calls wait their turn"
+    )
+    gemini_batch_mode: bool = Field(
+        default=False,
+        description="Enrich article batches with a Gemini batch job (cheaper, but slow; for offline pipelines)"
+    )
+    gemini_batch_poll_interval: float = Field(
+        default=10.0,
+        description="Seconds between Gemini batch job status checks"
+    )
+    gemini_batch_timeout: float = Field(
+        default=300.0,
+        description="Seconds to wait for a Gemini batch job before cancelling it and enriching articles individually"
+    )
+    ai_cache_ttl: int = Field(
+        default=3600,
+        description="Seconds a cached Gemini response stays valid (0 disables)"
+    )
+    ai_cache_size: int = Field(
+        default=512,
+        description="Maximum number of cached Gemini responses"
+    )
     
     # Brave Search API settings for media discovery
     brave_api_key: Optional[str] = Field(
@@ -65,6 +104,28 @@ class Settings(BaseSettings):
         default="https://api.search.brave.com/res/v1/videos/search",
         description="Brave Search API endpoint for video search"
     )
+    brave_parallel_search: bool = Field(
+        default=False,
+        description="Run Brave image and video searches concurrently (needs a plan allowing over 1 request/second)"
+    )
+    use_brave_media_discovery: bool = Field(
+        default=True,
+        description="Discover media via Brave Search instead of the URLs suggested by Gemini"
+    )
+    use_llm_search_query: bool = Field(
+        default=False,
+        description="Ask Gemini for the media search query instead of building it from the title and tags"
+    )
+    
+    # Batch ingestion settings
+    ingest_batch_concurrency: int = Field(
+        default=8,
+        description="Articles enriched concurrently by the batch ingestion endpoint"
+    )
+    ingest_batch_max_size: int = Field(
+        default=100,
+        description="Maximum number of articles accepted per batch ingestion request"
+    )
     
     # Database settings
     database_url: Optional[str] = Field(
@@ -95,7 +156,7 @@ class Settings(BaseSettings):
     
     # Database connection pool settings
     db_pool_size: int = Field(
-        default=5,
+        default=20,
         description="Database connection pool size"
     )
     db_max_overflow: int = Field(
@@ -107,9 +168,29 @@ class Settings(BaseSettings):
         description="Timeout for getting connection from pool (seconds)"
     )
     db_pool_recycle: int = Field(
-        default=3600,
+        default=1800,
         description="Recycle connections after this many seconds"
     )
+    db_statement_cache_size: int = Field(
+        default=1024,
+        description="asyncpg prepared statement cache size per connection"
+    )
+    
+    # Repository read cache settings. The caches are in-process: a write only
+    # invalidates the worker that made it, so with WEB_CONCURRENCY > 1 other
+    # workers may serve a stale article or count until its TTL expires.
+    news_cache_ttl: int = Field(
+        default=300,
+        description="Seconds a cached article lookup stays valid (0 disables)"
+    )
+    news_cache_size: int = Field(
+        default=1024,
+        description="Maximum number of cached article lookups"
+    )
+    news_count_cache_ttl: int = Field(
+        default=10,
+        description="Seconds the cached article count stays valid (0 disables)"
+    )
     
     # CORS settings
     allowed_origins: str = Field(
@@ -123,6 +204,20 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, loading them on first use.
+    
+    Usable as a FastAPI dependency (Depends(get_settings)); tests can reset
+    it with get_settings.cache_clear().
+    
+    Returns:
+        The shared Settings instance
+    """
+    return Settings()
+
+
+# Global settings instance for import-time access (same object as get_settings())
+settings = get_settings()
 
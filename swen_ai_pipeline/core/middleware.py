@@ -0,0 +1,213 @@
+"""
+Pure ASGI middleware for CORS handling and unhandled-error responses.
+
+Both classes work directly on ASGI scopes and messages, so they avoid
+building Starlette Request/Response objects on every request.
+"""
+import logging
+from typing import Iterable, List, Tuple
+
+import orjson
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+logger = logging.getLogger("swen.middleware")
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+Headers = List[Tuple[bytes, bytes]]
+
+# Static part of the 500 body; only the request URL is filled in per error.
+# Exception text is logged but never returned, as it can leak internals.
+_ERROR_BODY_PREFIX = b'{"error":"Internal Server Error","detail":"internal error","path":'
+_ERROR_BODY_SUFFIX = b"}"
+
+
+class CORSAsgiMiddleware:
+    """
+    CORS middleware with all header values encoded once at startup.
+
+    Behaves like Starlette's CORSMiddleware configured with
+    allow_headers=["*"]: requested headers are always echoed on preflight.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = ("*",),
+        allow_methods: Iterable[str] = ALL_METHODS,
+        allow_credentials: bool = False,
+        max_age: int = 600
+    ):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+            allow_origins: Allowed origins ("*" allows any origin)
+            allow_methods: Allowed methods ("*" allows all methods)
+            allow_credentials: Whether to allow credentialed requests
+            max_age: Seconds browsers may cache a preflight response
+        """
+        origins = frozenset(allow_origins)
+        methods = ALL_METHODS if "*" in allow_methods else tuple(allow_methods)
+
+        self.app = app
+        self.allow_all_origins = "*" in origins
+        self.allow_origins = frozenset(o.encode("latin-1") for o in origins if o != "*")
+        self.allow_methods = frozenset(m.encode("latin-1") for m in methods)
+        self.allow_credentials = allow_credentials
+
+        credentials: Headers = (
+            [(b"access-control-allow-credentials", b"true")] if allow_credentials else []
+        )
+        # Wildcard responses are only valid without cookies (or credentials
+        # on preflight); otherwise the request origin is echoed back
+        self._wildcard_headers: Headers = [(b"access-control-allow-origin", b"*"), *credentials]
+        self._explicit_headers: Headers = [*credentials, (b"vary", b"Origin")]
+        self._preflight_headers: Headers = [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            *credentials
+        ]
+        self._preflight_wildcard = self.allow_all_origins and not allow_credentials
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        has_cookie = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+            elif name == b"cookie":
+                has_cookie = True
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self.allow_all_origins or origin in self.allow_origins
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin, allowed, request_method, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        if self.allow_all_origins and not has_cookie:
+            extra = self._wildcard_headers
+        else:
+            extra = [(b"access-control-allow-origin", origin), *self._explicit_headers]
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *extra]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(
+        self,
+        send: Send,
+        origin: bytes,
+        allowed: bool,
+        request_method: bytes,
+        request_headers: bytes | None
+    ) -> None:
+        """
+        Answer a CORS preflight request without calling the application.
+
+        Args:
+            send: ASGI send callable
+            origin: Request Origin header
+            allowed: Whether the origin is allowed
+            request_method: Access-Control-Request-Method header
+            request_headers: Access-Control-Request-Headers header, if any
+        """
+        headers = list(self._preflight_headers)
+        failures = []
+
+        if self._preflight_wildcard:
+            headers.append((b"access-control-allow-origin", b"*"))
+        else:
+            headers.append((b"vary", b"Origin"))
+            if allowed:
+                headers.append((b"access-control-allow-origin", origin))
+        if not allowed:
+            failures.append("origin")
+
+        if request_method not in self.allow_methods:
+            failures.append("method")
+
+        if request_headers is not None:
+            headers.append((b"access-control-allow-headers", request_headers))
+
+        if failures:
+            status, body = 400, ("Disallowed CORS " + ", ".join(failures)).encode()
+        else:
+            status, body = 200, b"OK"
+
+        headers.append((b"content-type", b"text/plain; charset=utf-8"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+
+class ExceptionAsgiMiddleware:
+    """
+    Turns unhandled exceptions into a JSON 500 response.
+
+    Exceptions raised after the response has started are re-raised
+    so the server can close the connection.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_tracking(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_tracking)
+        except Exception:
+            logger.exception("Unhandled error while serving %s", scope.get("path"))
+            if response_started:
+                raise
+
+            # orjson.dumps() on the URL string produces a quoted, escaped JSON string
+            body = _ERROR_BODY_PREFIX + orjson.dumps(str(URL(scope=scope))) + _ERROR_BODY_SUFFIX
+            await send({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1"))
+                ]
+            })
+            await send({"type": "http.response.body", "body": body})
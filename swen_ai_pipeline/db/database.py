@@ -1,18 +1,24 @@
 """
 Database connection and session management.
 """
-from typing import AsyncGenerator
+import asyncio
+import logging
+from typing import AsyncGenerator, Any, Dict
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncSession,
     async_sessionmaker,
     AsyncEngine
 )
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from swen_ai_pipeline.core.config import settings
 from swen_ai_pipeline.db.models import Base
 
 
+logger = logging.getLogger("swen.db")
+
+
 class Database:
     """
     Database connection manager.
@@ -25,28 +31,62 @@ class Database:
         """Initialize the database manager."""
         self.engine: AsyncEngine | None = None
         self.async_session_maker: async_sessionmaker[AsyncSession] | None = None
+        self._create_tables_task: asyncio.Task | None = None
     
-    def init(self, database_url: str | None = None):
+    def init(
+        self,
+        database_url: str | None = None,
+        pool_size: int | None = None,
+        max_overflow: int | None = None,
+        pool_timeout: int | None = None,
+        pool_recycle: int | None = None,
+        pool_pre_ping: bool = True
+    ):
         """
         Initialize database engine and session maker.
         
         Args:
             database_url: Database connection URL. If None, uses settings.database_url
+            pool_size: Persistent connections kept in the pool. If None, uses settings.db_pool_size
+            max_overflow: Extra connections allowed beyond pool_size. If None, uses settings.db_max_overflow
+            pool_timeout: Seconds to wait for a free connection. If None, uses settings.db_pool_timeout
+            pool_recycle: Seconds before a connection is replaced. If None, uses settings.db_pool_recycle
+            pool_pre_ping: Whether to check connections for liveness on checkout
         """
         url = database_url or settings.database_url
+        pool_size = settings.db_pool_size if pool_size is None else pool_size
+        max_overflow = settings.db_max_overflow if max_overflow is None else max_overflow
+        pool_timeout = settings.db_pool_timeout if pool_timeout is None else pool_timeout
+        pool_recycle = settings.db_pool_recycle if pool_recycle is None else pool_recycle
         
         if not url:
             raise ValueError("Database URL is required")
         
-        # Create async engine with connection pooling
+        connect_args: Dict[str, Any] = {}
+        if make_url(url).get_driver_name() == "asyncpg":
+            # Short OLTP queries don't benefit from JIT; a larger prepared
+            # statement cache avoids re-parsing repeated queries server-side
+            connect_args = {
+                "server_settings": {"jit": "off"},
+                "statement_cache_size": settings.db_statement_cache_size,
+            }
+        
+        # Create async engine with a persistent connection pool
         self.engine = create_async_engine(
             url,
             echo=settings.environment == "development",
-            pool_size=settings.db_pool_size,
-            max_overflow=settings.db_max_overflow,
-            pool_timeout=settings.db_pool_timeout,
-            pool_recycle=settings.db_pool_recycle,
-            pool_pre_ping=True,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            connect_args=connect_args,
+        )
+        logger.info(
+            "Database pool configured: pool_size=%d max_overflow=%d",
+            pool_size,
+            max_overflow,
         )
         
         # Create session maker
@@ -66,6 +106,41 @@ class Database:
         async with self.engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
     
+    def create_tables_in_background(self) -> asyncio.Task:
+        """
+        Start create_tables() as a background task so startup doesn't wait on DDL.
+        
+        Sessions handed out by get_session() wait for the task to finish first.
+        
+        Returns:
+            The scheduled task
+        """
+        task = asyncio.create_task(self.create_tables())
+        task.add_done_callback(self._on_tables_created)
+        self._create_tables_task = task
+        return task
+    
+    @staticmethod
+    def _on_tables_created(task: asyncio.Task):
+        """Log the outcome of the background create_tables() task."""
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            logger.error("Database table creation failed: %s", task.exception())
+        else:
+            logger.info("Database tables ready")
+    
+    async def wait_until_ready(self):
+        """
+        Wait for background table creation, if any, to finish.
+        
+        A failed creation is not re-raised here; it was already logged, and
+        queries will surface the underlying error if tables are missing.
+        """
+        task = self._create_tables_task
+        if task is not None and not task.done():
+            await asyncio.wait((task,))
+    
     async def drop_tables(self):
         """Drop all database tables. Use with caution!"""
         if not self.engine:
@@ -76,6 +151,10 @@ class Database:
     
     async def close(self):
         """Close database connections."""
+        if self._create_tables_task is not None and not self._create_tables_task.done():
+            self._create_tables_task.cancel()
+        self._create_tables_task = None
+        
         if self.engine:
             await self.engine.dispose()
             self.engine = None
@@ -95,6 +174,8 @@ class Database:
         if not self.async_session_maker:
             raise RuntimeError("Database not initialized. Call init() first.")
         
+        await self.wait_until_ready()
+        
         async with self.async_session_maker() as session:
             try:
                 yield session
@@ -2,8 +2,9 @@
 SQLAlchemy database models for news articles.
 """
 from datetime import datetime
-from typing import List
-from sqlalchemy import String, Text, Float, DateTime, JSON, Integer
+from typing import List, Any
+from sqlalchemy import String, Text, Float, DateTime, JSON, Integer, Index, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -40,7 +41,7 @@ class NewsArticle(Base):
     
     # AI-generated content
     summary: Mapped[str] = mapped_column(Text, nullable=False)
-    tags: Mapped[List[str]] = mapped_column(JSON, nullable=False)
+    tags: Mapped[List[str]] = mapped_column(JSONB, nullable=False)
     
     # Sentiment analysis
     sentiment_label: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -72,6 +73,18 @@ class NewsArticle(Base):
         server_default=func.now()
     )
     
+    # Full-text search vector, maintained by PostgreSQL (never loaded by default)
+    tsv: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(title, '') || ' ' || "
+            "coalesce(summary, '') || ' ' || coalesce(body, ''))",
+            persisted=True
+        ),
+        nullable=True,
+        deferred=True
+    )
+    
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -118,3 +131,12 @@ class NewsArticle(Base):
             "updated_at": self.updated_at.isoformat()
         }
 
+
+# Index-backed ordering for list pages (ORDER BY ingested_at DESC LIMIT/OFFSET)
+# and search results (ORDER BY relevance_score DESC)
+Index("ix_news_articles_ingested_at_desc", NewsArticle.ingested_at.desc())
+Index("ix_news_articles_relevance_score_desc", NewsArticle.relevance_score.desc())
+
+# GIN indexes backing search_news (full-text match and tag containment)
+Index("ix_news_articles_tsv", NewsArticle.tsv, postgresql_using="gin")
+Index("ix_news_articles_tags", NewsArticle.tags, postgresql_using="gin")
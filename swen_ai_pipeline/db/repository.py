@@ -1,14 +1,74 @@
 """
 Handles saving and retrieving news articles from PostgreSQL database.
 """
-from typing import Optional, List
-from sqlalchemy import select, func, or_
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+from sqlalchemy import select, delete, event, func, or_, bindparam, Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
-from swen_ai_pipeline.models.data_models import FinalNewsOutput
+from swen_ai_pipeline.models.data_models import (
+    FinalNewsOutput,
+    NewsSummary,
+    EnrichedNewsMedia,
+    EnrichedNewsContext,
+    Geo
+)
+from swen_ai_pipeline.core.config import settings
+from swen_ai_pipeline.db.cache import TTLCache
 from swen_ai_pipeline.db.models import NewsArticle
 
 
+# Statements shared by every request; the slug is bound at execution time
+_SELECT_BY_SLUG = select(NewsArticle).where(NewsArticle.slug == bindparam("slug"))
+_DELETE_BY_SLUG = (
+    delete(NewsArticle)
+    .where(NewsArticle.slug == bindparam("slug"))
+    .execution_options(synchronize_session=False)
+)
+_EXISTS_BY_SLUG = select(1).where(NewsArticle.slug == bindparam("slug")).limit(1)
+_COUNT_ALL = select(func.count()).select_from(NewsArticle)
+
+# Read caches for hot lookups, invalidated once save_news/delete_news commit.
+# They live in the worker process: other workers keep serving their own
+# entries until the TTL runs out.
+_article_cache = TTLCache(maxsize=settings.news_cache_size, ttl=settings.news_cache_ttl)
+_count_cache = TTLCache(maxsize=1, ttl=settings.news_count_cache_ttl)
+_COUNT_KEY = "count"
+
+# Session.info key holding the article IDs written in the current transaction
+_STALE_IDS_KEY = "swen_stale_news_ids"
+
+# Rows fetched per round trip when streaming large result sets
+_STREAM_BATCH_SIZE = 100
+
+# Rows per multi-row INSERT; 22 bound columns per row keeps each statement
+# well under the PostgreSQL limit of 32767 bind parameters
+_BULK_CHUNK_SIZE = 500
+
+# Columns overwritten when an article with the same slug is saved again;
+# ingested_at included, so a re-save stores the timestamp it responded with
+_UPSERT_COLUMNS = (
+    "title", "body", "source_url", "author", "published_date", "summary", "tags",
+    "sentiment_label", "sentiment_score", "images", "videos", "relevance_score",
+    "featured_image_url", "related_video_url", "media_justification",
+    "wikipedia_snippet", "search_trend", "geo_lat", "geo_lng", "map_url",
+    "ingested_at"
+)
+
+# Columns needed to build a NewsSummary for list pages
+_SUMMARY_COLUMNS = (
+    NewsArticle.slug,
+    NewsArticle.title,
+    NewsArticle.summary,
+    NewsArticle.tags,
+    NewsArticle.relevance_score,
+    NewsArticle.published_date,
+    NewsArticle.ingested_at,
+    NewsArticle.featured_image_url
+)
+
+
 class NewsRepository:
     """
     Repository for news article data access using PostgreSQL.
@@ -30,6 +90,8 @@ class NewsRepository:
         """
         Save a news article to the database.
         
+        Thin wrapper over save_news_bulk with a one-element list.
+        
         Args:
             news: The enriched news article to save
             
@@ -39,81 +101,46 @@ class NewsRepository:
         Raises:
             Exception: If save operation fails
         """
-        try:
-            # Check if article already exists (use UUID as slug for now)
-            existing = await self.get_news_by_id(news.id)
+        await self.save_news_bulk([news])
+        return news
+    
+    async def save_news_bulk(self, items: List[FinalNewsOutput]) -> List[FinalNewsOutput]:
+        """
+        Save many news articles with multi-row upserts.
+        
+        Articles are written in chunks of _BULK_CHUNK_SIZE rows, one
+        INSERT ... VALUES (...), (...) ON CONFLICT (slug) DO UPDATE per chunk.
+        If the same ID appears more than once, the last occurrence wins.
+        
+        Args:
+            items: The enriched news articles to save
             
-            if existing:
-                # Update existing article
-                stmt = select(NewsArticle).where(NewsArticle.slug == news.id)
-                result = await self.session.execute(stmt)
-                db_article = result.scalar_one()
-                
-                # Update fields
-                db_article.title = news.title
-                db_article.body = news.body
-                db_article.source_url = news.source_url
-                db_article.author = news.publisher
-                db_article.published_date = news.published_at
-                db_article.summary = news.summary
-                db_article.tags = news.tags
-                db_article.sentiment_label = news.context.social_sentiment if news.context else "neutral"
-                db_article.sentiment_score = 0.0  
-                db_article.images = [] 
-                db_article.videos = [] 
-                db_article.relevance_score = news.relevance_score
-                
-                # Update SWEN schema fields
-                if news.media:
-                    db_article.featured_image_url = news.media.featured_image_url
-                    db_article.related_video_url = news.media.related_video_url
-                    db_article.media_justification = news.media.media_justification
-                
-                if news.context:
-                    db_article.wikipedia_snippet = news.context.wikipedia_snippet
-                    db_article.search_trend = news.context.search_trend
-                
-                if news.geo:
-                    db_article.geo_lat = news.geo.lat
-                    db_article.geo_lng = news.geo.lng
-                    db_article.map_url = news.geo.map_url
-            else:
-                # Create new article (use UUID as slug)
-                db_article = NewsArticle(
-                    slug=news.id,  # Use UUID as slug
-                    title=news.title,
-                    body=news.body,
-                    source_url=news.source_url,
-                    author=news.publisher,
-                    published_date=news.published_at,
-                    summary=news.summary,
-                    tags=news.tags,
-                    sentiment_label=news.context.social_sentiment if news.context else "neutral",
-                    sentiment_score=0.0,  
-                    images=[],  
-                    videos=[],  
-                    relevance_score=news.relevance_score,
-                    # SWEN schema fields
-                    featured_image_url=news.media.featured_image_url if news.media else None,
-                    related_video_url=news.media.related_video_url if news.media else None,
-                    media_justification=news.media.media_justification if news.media else None,
-                    wikipedia_snippet=news.context.wikipedia_snippet if news.context else None,
-                    search_trend=news.context.search_trend if news.context else None,
-                    geo_lat=news.geo.lat if news.geo else None,
-                    geo_lng=news.geo.lng if news.geo else None,
-                    map_url=news.geo.map_url if news.geo else None
-                )
-                self.session.add(db_article)
+        Returns:
+            The saved news articles (deduplicated by ID)
             
-            await self.session.flush()
-            return news
+        Raises:
+            Exception: If save operation fails
+        """
+        # A single ON CONFLICT DO UPDATE statement cannot touch a row twice
+        unique = list({news.id: news for news in items}.values())
+        
+        try:
+            for start in range(0, len(unique), _BULK_CHUNK_SIZE):
+                chunk = unique[start:start + _BULK_CHUNK_SIZE]
+                await self.session.execute(
+                    self._upsert_stmt([self._to_row(news) for news in chunk])
+                )
+            self._invalidate_on_commit(news.id for news in unique)
+            return unique
         except Exception as e:
-            raise Exception(f"Failed to save news article: {str(e)}")
+            raise Exception(f"Failed to save news articles: {str(e)}")
     
     async def get_news_by_id(self, article_id: str) -> Optional[FinalNewsOutput]:
         """
         Retrieve a news article by its unique ID.
         
+        Recently read articles are served from an in-process TTL cache.
+        
         Args:
             article_id: The unique UUID identifier
             
@@ -121,14 +148,18 @@ class NewsRepository:
             The news article if found, None otherwise
         """
         # In the database, we store the UUID as the slug field
-        stmt = select(NewsArticle).where(NewsArticle.slug == article_id)
-        result = await self.session.execute(stmt)
-        db_article = result.scalar_one_or_none()
+        cached = _article_cache.get(article_id)
+        if cached is not None:
+            return cached
+        
+        db_article = await self.session.scalar(_SELECT_BY_SLUG, {"slug": article_id})
         
         if not db_article:
             return None
         
-        return self._to_output_model(db_article)
+        news = self._to_output_model(db_article)
+        _article_cache.set(article_id, news)
+        return news
     
     async def get_news_by_slug(self, slug: str) -> Optional[FinalNewsOutput]:
         """
@@ -159,22 +190,91 @@ class NewsRepository:
             .order_by(NewsArticle.ingested_at.desc())
             .limit(limit)
             .offset(offset)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
+        )
+        result = await self.session.stream_scalars(stmt)
+        
+        return [self._to_output_model(article) async for article in result]
+    
+    async def get_all_news_with_total(
+        self, limit: int = 100, offset: int = 0
+    ) -> Tuple[List[FinalNewsOutput], int]:
+        """
+        Retrieve a page of news articles together with the total article count.
+        
+        The total is computed with COUNT(*) OVER () in the same statement, so a
+        list page needs a single round trip instead of two.
+        
+        Args:
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+            
+        Returns:
+            Tuple of (news articles newest first, total number of articles)
+        """
+        stmt = (
+            select(NewsArticle, func.count().over().label("total"))
+            .order_by(NewsArticle.ingested_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        result = await self.session.execute(stmt)
+        rows = result.all()
+        
+        if not rows:
+            # The window count rides on the returned rows; an empty page needs its own count
+            total = await self.get_news_count() if offset else 0
+            return [], total
+        
+        return [self._to_output_model(article) for article, _ in rows], rows[0].total
+    
+    async def get_all_news_summaries(
+        self, limit: int = 100, offset: int = 0
+    ) -> Tuple[List[NewsSummary], int]:
+        """
+        Retrieve a page of news summaries together with the total article count.
+        
+        Only the columns shown in a summary are selected, so large fields such as
+        the article body are never sent over the wire for list pages.
+        
+        Args:
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+            
+        Returns:
+            Tuple of (news summaries newest first, total number of articles)
+        """
+        stmt = (
+            select(*_SUMMARY_COLUMNS, func.count().over().label("total"))
+            .order_by(NewsArticle.ingested_at.desc())
+            .limit(limit)
+            .offset(offset)
         )
         result = await self.session.execute(stmt)
-        db_articles = result.scalars().all()
+        rows = result.all()
         
-        return [self._to_output_model(article) for article in db_articles]
+        if not rows:
+            total = await self.get_news_count() if offset else 0
+            return [], total
+        
+        return [self._to_summary_model(row) for row in rows], rows[0].total
     
     async def get_news_count(self) -> int:
         """
         Get the total count of stored news articles.
         
+        The count is cached in-process for a few seconds.
+        
         Returns:
             Total number of articles in the repository
         """
-        stmt = select(func.count()).select_from(NewsArticle)
-        result = await self.session.execute(stmt)
-        return result.scalar_one()
+        cached = _count_cache.get(_COUNT_KEY)
+        if cached is not None:
+            return cached
+        
+        count = await self.session.scalar(_COUNT_ALL)
+        _count_cache.set(_COUNT_KEY, count)
+        return count
     
     async def delete_news(self, slug: str) -> bool:
         """
@@ -186,16 +286,9 @@ class NewsRepository:
         Returns:
             True if deleted, False if not found
         """
-        stmt = select(NewsArticle).where(NewsArticle.slug == slug)
-        result = await self.session.execute(stmt)
-        db_article = result.scalar_one_or_none()
-        
-        if not db_article:
-            return False
-        
-        await self.session.delete(db_article)
-        await self.session.flush()
-        return True
+        result = await self.session.execute(_DELETE_BY_SLUG, {"slug": slug})
+        self._invalidate_on_commit((slug,))
+        return result.rowcount > 0
     
     async def news_exists(self, slug: str) -> bool:
         """
@@ -207,15 +300,13 @@ class NewsRepository:
         Returns:
             True if exists, False otherwise
         """
-        stmt = select(func.count()).select_from(NewsArticle).where(NewsArticle.slug == slug)
-        result = await self.session.execute(stmt)
-        count = result.scalar_one()
-        return count > 0
+        return await self.session.scalar(_EXISTS_BY_SLUG, {"slug": slug}) is not None
     
     async def search_news(self, query: str, limit: int = 50) -> List[FinalNewsOutput]:
         """
         Search news articles by query string.
-        Searches in title, body, summary, and tags.
+        Matches title, body and summary through the full-text index and
+        tags by exact containment, ranked by full-text relevance.
         
         Args:
             query: Search query string
@@ -224,25 +315,120 @@ class NewsRepository:
         Returns:
             List of matching news articles
         """
-        search_term = f"%{query}%"
+        ts_query = func.plainto_tsquery("english", query)
         
         stmt = (
             select(NewsArticle)
             .where(
                 or_(
-                    NewsArticle.title.ilike(search_term),
-                    NewsArticle.body.ilike(search_term),
-                    NewsArticle.summary.ilike(search_term),
-                    NewsArticle.tags.cast(str).ilike(search_term)
+                    NewsArticle.tsv.op("@@")(ts_query),
+                    NewsArticle.tags.contains([query])
                 )
             )
-            .order_by(NewsArticle.relevance_score.desc())
+            .order_by(
+                func.ts_rank(NewsArticle.tsv, ts_query).desc(),
+                NewsArticle.relevance_score.desc()
+            )
             .limit(limit)
+            .execution_options(yield_per=_STREAM_BATCH_SIZE)
         )
-        result = await self.session.execute(stmt)
-        db_articles = result.scalars().all()
+        result = await self.session.stream_scalars(stmt)
         
-        return [self._to_output_model(article) for article in db_articles]
+        return [self._to_output_model(article) async for article in result]
+    
+    def _invalidate_on_commit(self, article_ids: Iterable[str]):
+        """
+        Drop the given articles and the count from the read caches once the
+        session's transaction commits.
+        
+        Invalidating before the commit would let a concurrent reader re-cache
+        the old committed row for a full TTL.
+        
+        Args:
+            article_ids: IDs of the articles written in this transaction
+        """
+        self.session.info.setdefault(_STALE_IDS_KEY, set()).update(article_ids)
+    
+    @staticmethod
+    def _upsert_stmt(rows: List[Dict[str, Any]]):
+        """
+        Build an INSERT ... ON CONFLICT (slug) DO UPDATE statement for rows.
+        
+        Args:
+            rows: Row values as produced by _to_row
+            
+        Returns:
+            The upsert statement
+        """
+        stmt = pg_insert(NewsArticle).values(rows)
+        return stmt.on_conflict_do_update(
+            index_elements=[NewsArticle.slug],
+            set_={
+                **{column: stmt.excluded[column] for column in _UPSERT_COLUMNS},
+                # ON CONFLICT bypasses the ORM onupdate hook, so bump it explicitly
+                "updated_at": func.now()
+            }
+        )
+    
+    @staticmethod
+    def _to_row(news: FinalNewsOutput) -> Dict[str, Any]:
+        """
+        Convert output model to a news_articles row.
+        
+        Args:
+            news: The enriched news article
+            
+        Returns:
+            Column values keyed by column name (UUID is stored as slug)
+        """
+        return {
+            "slug": news.id,
+            "title": news.title,
+            "body": news.body,
+            "source_url": news.source_url,
+            "author": news.publisher,
+            "published_date": news.published_at,
+            "summary": news.summary,
+            "tags": news.tags,
+            "sentiment_label": news.context.social_sentiment if news.context else "neutral",
+            "sentiment_score": 0.0,
+            "images": [],
+            "videos": [],
+            "relevance_score": news.relevance_score,
+            # SWEN schema fields
+            "featured_image_url": news.media.featured_image_url if news.media else None,
+            "related_video_url": news.media.related_video_url if news.media else None,
+            "media_justification": news.media.media_justification if news.media else None,
+            "wikipedia_snippet": news.context.wikipedia_snippet if news.context else None,
+            "search_trend": news.context.search_trend if news.context else None,
+            "geo_lat": news.geo.lat if news.geo else None,
+            "geo_lng": news.geo.lng if news.geo else None,
+            "map_url": news.geo.map_url if news.geo else None,
+            # The ingestion timestamp the API returned (shared by a whole batch)
+            "ingested_at": news.ingested_at
+        }
+    
+    @staticmethod
+    def _to_summary_model(row: Row) -> NewsSummary:
+        """
+        Convert a projected summary row to output model.
+        
+        Args:
+            row: Row selected from _SUMMARY_COLUMNS
+            
+        Returns:
+            NewsSummary model for list responses
+        """
+        return NewsSummary.model_construct(
+            id=row.slug,  # slug field stores the UUID
+            title=row.title,
+            summary=row.summary,
+            tags=row.tags,
+            relevance_score=row.relevance_score,
+            published_at=row.published_date,
+            ingested_at=row.ingested_at,
+            featured_image_url=row.featured_image_url
+        )
     
     def _to_output_model(self, db_article: NewsArticle) -> FinalNewsOutput:
         """
@@ -254,30 +440,27 @@ class NewsRepository:
         Returns:
             FinalNewsOutput model for API responses
         """
-        from swen_ai_pipeline.models.data_models import (
-            EnrichedNewsMedia, EnrichedNewsContext, Geo
-        )
-        
-        # Reconstruct enriched objects from stored data
-        media = EnrichedNewsMedia(
+        # Rows come from our own table and were validated on ingest, so the
+        # output models are built with model_construct() to skip re-validation.
+        media = EnrichedNewsMedia.model_construct(
             featured_image_url=db_article.featured_image_url,
             related_video_url=db_article.related_video_url,
             media_justification=db_article.media_justification
         )
         
-        context = EnrichedNewsContext(
+        context = EnrichedNewsContext.model_construct(
             wikipedia_snippet=db_article.wikipedia_snippet,
             social_sentiment=db_article.sentiment_label,
             search_trend=db_article.search_trend
         )
         
-        geo = Geo(
+        geo = Geo.model_construct(
             lat=db_article.geo_lat,
             lng=db_article.geo_lng,
             map_url=db_article.map_url
         )
         
-        return FinalNewsOutput(
+        return FinalNewsOutput.model_construct(
             id=db_article.slug,  # slug field stores the UUID
             title=db_article.title,
             body=db_article.body,
@@ -290,10 +473,27 @@ class NewsRepository:
             media=media,
             context=context,
             geo=geo,
-            ingested_at=db_article.ingested_at.isoformat() if hasattr(db_article.ingested_at, 'isoformat') else str(db_article.ingested_at)
+            ingested_at=db_article.ingested_at
         )
 
 
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_news(session: Session):
+    """Evict the articles a committed transaction wrote from the read caches."""
+    stale_ids = session.info.pop(_STALE_IDS_KEY, None)
+    if stale_ids is None:
+        return
+    for article_id in stale_ids:
+        _article_cache.pop(article_id)
+    _count_cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_rolled_back_news(session: Session):
+    """Forget pending invalidations; a rolled back write changed nothing."""
+    session.info.pop(_STALE_IDS_KEY, None)
+
+
 def get_repository(session: AsyncSession) -> NewsRepository:
     """
     Factory function to create a repository instance.
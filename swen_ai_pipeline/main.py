@@ -1,14 +1,87 @@
 """
 FastAPI application entry point for the SWEN AI-Enriched News Pipeline.
 """
+import logging
+from contextlib import asynccontextmanager
+
+import orjson
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 
 from swen_ai_pipeline.core.config import settings
+from swen_ai_pipeline.core.middleware import CORSAsgiMiddleware, ExceptionAsgiMiddleware
 from swen_ai_pipeline.api.v1.endpoints import router as api_v1_router
 
 
+logger = logging.getLogger("swen")
+
+
+# Application lifespan: startup runs before the yield, shutdown after it
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize connections on startup and clean them up on shutdown.
+    
+    Args:
+        app: The FastAPI application
+    """
+    from swen_ai_pipeline.db.database import database
+    from swen_ai_pipeline.services.ai_service import get_ai_service
+    from swen_ai_pipeline.services.brave_search_service import brave_search_service
+    
+    # No-op if logging is already configured (e.g. by the test runner)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    
+    logger.info("🚀 Starting %s v%s", settings.app_name, settings.app_version)
+    logger.info("📝 Environment: %s", settings.environment)
+    logger.info(
+        "🤖 AI Service: %s",
+        "Mock" if settings.use_mock_ai else f"Google {settings.gemini_model}"
+    )
+    
+    # Initialize database if URL is configured
+    if settings.database_url:
+        try:
+            logger.info("🗄️  Initializing database connection...")
+            database.init(
+                settings.database_url,
+                pool_size=settings.db_pool_size,
+                max_overflow=settings.db_max_overflow,
+                pool_timeout=settings.db_pool_timeout,
+                pool_recycle=settings.db_pool_recycle,
+                pool_pre_ping=True
+            )
+            
+            # Create tables if they don't exist, without holding up startup;
+            # database sessions wait for this to finish
+            database.create_tables_in_background()
+            logger.info("✅ Database initialized (creating tables in background)")
+        except Exception as e:
+            logger.warning("⚠️  Database initialization failed: %s", e)
+            logger.warning("⚠️  Running without database persistence")
+    else:
+        logger.warning("⚠️  No database URL configured, skipping database initialization")
+    
+    # Create the AI service (and its Gemini client) before the first request
+    ai_service = get_ai_service()
+    
+    logger.info("📚 API Documentation: http://%s:%s/docs", settings.host, settings.port)
+    
+    yield
+    
+    logger.info("👋 Shutting down %s", settings.app_name)
+    
+    # Close database connections
+    if database.engine:
+        logger.info("🗄️  Closing database connections...")
+        await database.close()
+        logger.info("✅ Database connections closed")
+    
+    # Close the Gemini and Brave clients' HTTP connections
+    await ai_service.close()
+    await brave_search_service.aclose()
+
+
 # Create FastAPI application instance
 app = FastAPI(
     title=settings.app_name,
@@ -18,17 +91,28 @@ app = FastAPI(
     version=settings.app_version,
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
+
+
+# CORS policy, normalized once at import; the middleware pre-encodes these to bytes
+_ALLOW_ORIGINS = frozenset(
+    origin.strip() for origin in settings.allowed_origins.split(",") if origin.strip()
 )
+_ALLOW_METHODS = ("*",)
+
 
+# Global exception handler: turns unhandled errors into a JSON 500 response
+app.add_middleware(ExceptionAsgiMiddleware)
 
-# Configure CORS middleware
+# Configure CORS middleware (outermost, so error responses carry CORS headers too)
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"] if settings.allowed_origins == "*" else settings.allowed_origins.split(","),
+    CORSAsgiMiddleware,
+    allow_origins=_ALLOW_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=_ALLOW_METHODS,
 )
 
 
@@ -40,6 +124,22 @@ app.include_router(
 )
 
 
+# Root payload never changes for a running process, so serialize it once
+_ROOT_RESPONSE = orjson.dumps({
+    "name": settings.app_name,
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "docs": "/docs",
+    "api_endpoints": {
+        "ingest": f"{settings.api_prefix}/ingest",
+        "get_news": f"{settings.api_prefix}/news/{{slug}}",
+        "list_news": f"{settings.api_prefix}/news",
+        "health": f"{settings.api_prefix}/health",
+        "stats": f"{settings.api_prefix}/stats"
+    }
+})
+
+
 # Root endpoint
 @app.get(
     "/",
@@ -49,96 +149,39 @@ app.include_router(
 )
 async def root():
     """Root endpoint returning API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "docs": "/docs",
-        "api_endpoints": {
-            "ingest": f"{settings.api_prefix}/ingest",
-            "get_news": f"{settings.api_prefix}/news/{{slug}}",
-            "list_news": f"{settings.api_prefix}/news",
-            "health": f"{settings.api_prefix}/health",
-            "stats": f"{settings.api_prefix}/stats"
-        }
-    }
-
-
-# Global exception handler
-@app.exception_handler(Exception)
-async def global_exception_handler(request, exc):
-    """Global exception handler for unhandled errors."""
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": "Internal Server Error",
-            "detail": str(exc),
-            "path": str(request.url)
-        }
-    )
-
-
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """
-    Execute on application startup.
-    Initialize connections, load models, etc.
-    """
-    from swen_ai_pipeline.db.database import database
-    import os
-
-    
-    print(os.getenv("DATABASE_URL"))
-    print(f"🚀 Starting {settings.app_name} v{settings.app_version}")
-    print(f"📝 Environment: {settings.environment}")
-    print(f"🤖 AI Service: {'Mock' if settings.use_mock_ai else f'Google {settings.gemini_model}'}")
-    
-    # Initialize database if URL is configured
-    if settings.database_url:
-        try:
-            print(f"🗄️  Initializing database connection...")
-            database.init(settings.database_url)
-            
-            # Create tables if they don't exist
-            await database.create_tables()
-            print(f"✅ Database initialized successfully")
-        except Exception as e:
-            print(f"⚠️  Database initialization failed: {e}")
-            print(f"⚠️  Running without database persistence")
-    else:
-        print(f"⚠️  No database URL configured, skipping database initialization")
-    
-    print(f"📚 API Documentation: http://{settings.host}:{settings.port}/docs")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """
-    Execute on application shutdown.
-    Close connections, cleanup resources, etc.
-    """
-    from swen_ai_pipeline.db.database import database
-    
-    print(f"👋 Shutting down {settings.app_name}")
-    
-    # Close database connections
-    if database.engine:
-        print(f"🗄️  Closing database connections...")
-        await database.close()
-        print(f"✅ Database connections closed")
+    return Response(_ROOT_RESPONSE, media_type="application/json")
 
 
 # Main entry point for running the application
 if __name__ == "__main__":
     import uvicorn
     
+    # Prefer the libuv event loop and C HTTP parser; fall back to the pure
+    # Python implementations where they aren't available (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+    
+    try:
+        import httptools  # noqa: F401
+        http = "httptools"
+    except ImportError:
+        http = "h11"
+    
+    # The reloader supervises a single process, so it can't run with workers
+    reload = settings.environment == "development"
+    workers = 1 if reload else settings.workers
+    
     uvicorn.run(
         "main:app",
         host=settings.host,
         port=settings.port,
-        reload=settings.environment == "development",
+        loop=loop,
+        http=http,
+        reload=reload,
+        workers=workers,
         log_level="info"
     )
 
@@ -5,122 +5,196 @@ Run this script to update your existing database schema.
 """
 
 import asyncio
-import os
+import logging
 from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from swen_ai_pipeline.db.database import database
 from swen_ai_pipeline.core.config import settings
 
+
+logger = logging.getLogger("swen.migrate")
+
+# Rows updated per transaction when backfilling source_url
+_BACKFILL_CHUNK_SIZE = 10_000
+
+_BACKFILL_SOURCE_URL = text("""
+    UPDATE news_articles 
+    SET source_url = 'https://example.com/legacy-article-' || id::text
+    WHERE id BETWEEN :first_id AND :last_id 
+    AND (source_url IS NULL OR source_url = 'https://example.com');
+""")
+
+# Indexes built after the schema changes commit, as (name, DDL) pairs
+_CONCURRENT_INDEXES = (
+    ("idx_news_articles_source_url", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_news_articles_source_url 
+        ON news_articles(source_url);
+    """),
+    # Back the list and search sort orders
+    ("ix_news_articles_ingested_at_desc", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_articles_ingested_at_desc 
+        ON news_articles(ingested_at DESC);
+    """),
+    ("ix_news_articles_relevance_score_desc", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_articles_relevance_score_desc 
+        ON news_articles(relevance_score DESC);
+    """),
+    # GIN indexes used by full-text and tag search
+    ("ix_news_articles_tsv", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_articles_tsv 
+        ON news_articles USING gin (tsv);
+    """),
+    ("ix_news_articles_tags", """
+        CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_news_articles_tags 
+        ON news_articles USING gin (tags);
+    """),
+)
+
 async def run_migration():
     """Run the database migration to add missing columns."""
     
-    print("🔄 Starting Database Migration...")
-    print("=" * 50)
+    logger.info("🔄 Starting Database Migration...")
+    logger.info("=" * 50)
     
     # Check if database URL is configured
     if not settings.database_url:
-        print("❌ No database URL configured. Please set DATABASE_URL environment variable.")
+        logger.error("❌ No database URL configured. Please set DATABASE_URL environment variable.")
         return False
     
-    print(f"📊 Database URL: {settings.database_url}")
+    logger.info(
+        "📊 Database URL: %s",
+        make_url(settings.database_url).render_as_string(hide_password=True)
+    )
     
     try:
         # Initialize database connection
         database.init(settings.database_url)
         
-        async with database.session() as session:
-            # Check if columns already exist
-            print("\n🔍 Checking existing columns...")
-            
-            check_columns_query = text("""
-                SELECT column_name, data_type, is_nullable
-                FROM information_schema.columns 
-                WHERE table_name = 'news_articles' 
-                AND column_name IN ('source_url', 'published_date')
-                ORDER BY column_name;
-            """)
-            
-            result = await session.execute(check_columns_query)
-            existing_columns = {row[0]: row for row in result.fetchall()}
-            
-            print(f"   Existing columns: {list(existing_columns.keys())}")
-            
-            # Add source_url column if it doesn't exist
-            if 'source_url' not in existing_columns:
-                print("\n➕ Adding source_url column...")
+        async with database.async_session_maker() as session:
+            # Apply every schema change in one transaction (committed on exit)
+            async with session.begin():
+                # Check existing columns with a single catalog query
+                logger.info("\n🔍 Checking existing columns...")
+                
+                check_columns_query = text("""
+                    SELECT column_name, data_type, is_nullable
+                    FROM information_schema.columns 
+                    WHERE table_name = 'news_articles' 
+                    AND column_name IN ('source_url', 'published_date', 'author', 'tags')
+                    ORDER BY column_name;
+                """)
+                
+                result = await session.execute(check_columns_query)
+                existing_columns = {row[0]: row for row in result.fetchall()}
+                
+                logger.info("   Existing columns: %s", list(existing_columns.keys()))
+                
+                # Add source_url column if it doesn't exist
+                if 'source_url' not in existing_columns:
+                    logger.info("\n➕ Adding source_url column...")
+                    await session.execute(text("""
+                        ALTER TABLE news_articles 
+                        ADD COLUMN source_url VARCHAR(1000);
+                    """))
+                    logger.info("   ✅ source_url column added")
+                else:
+                    logger.info("   ✅ source_url column already exists")
+                
+                # Add published_date column if it doesn't exist
+                if 'published_date' not in existing_columns:
+                    logger.info("\n➕ Adding published_date column...")
+                    await session.execute(text("""
+                        ALTER TABLE news_articles 
+                        ADD COLUMN published_date VARCHAR(50);
+                    """))
+                    logger.info("   ✅ published_date column added")
+                else:
+                    logger.info("   ✅ published_date column already exists")
+                
+                # Make author column nullable if it isn't already
+                logger.info("\n🔧 Checking author column...")
+                author_nullable = existing_columns["author"][2] if "author" in existing_columns else None
+                
+                if author_nullable == 'NO':
+                    logger.info("   Making author column nullable...")
+                    await session.execute(text("""
+                        ALTER TABLE news_articles 
+                        ALTER COLUMN author DROP NOT NULL;
+                    """))
+                    logger.info("   ✅ author column made nullable")
+                else:
+                    logger.info("   ✅ author column already nullable")
+                
+                # Remove default constraint from source_url
+                logger.info("\n🔧 Removing default constraint...")
                 await session.execute(text("""
                     ALTER TABLE news_articles 
-                    ADD COLUMN source_url VARCHAR(1000) NOT NULL DEFAULT 'https://example.com';
+                    ALTER COLUMN source_url DROP DEFAULT;
                 """))
-                print("   ✅ source_url column added")
-            else:
-                print("   ✅ source_url column already exists")
-            
-            # Add published_date column if it doesn't exist
-            if 'published_date' not in existing_columns:
-                print("\n➕ Adding published_date column...")
+                logger.info("   ✅ Default constraint removed")
+                
+                # Add full-text search column (indexed below)
+                logger.info("\n🔎 Adding search column...")
                 await session.execute(text("""
                     ALTER TABLE news_articles 
-                    ADD COLUMN published_date VARCHAR(50);
+                    ADD COLUMN IF NOT EXISTS tsv tsvector GENERATED ALWAYS AS (
+                        to_tsvector('english', coalesce(title, '') || ' ' || 
+                        coalesce(summary, '') || ' ' || coalesce(body, ''))
+                    ) STORED;
                 """))
-                print("   ✅ published_date column added")
-            else:
-                print("   ✅ published_date column already exists")
-            
-            # Make author column nullable if it isn't already
-            print("\n🔧 Checking author column...")
-            author_check_query = text("""
-                SELECT is_nullable 
-                FROM information_schema.columns 
-                WHERE table_name = 'news_articles' 
-                AND column_name = 'author';
-            """)
-            
-            result = await session.execute(author_check_query)
-            author_nullable = result.scalar()
-            
-            if author_nullable == 'NO':
-                print("   Making author column nullable...")
+                logger.info("   ✅ Search column added")
+                
+                # Store tags as JSONB so containment queries can use a GIN index
+                logger.info("\n🏷️  Converting tags to JSONB...")
+                if "tags" in existing_columns and existing_columns["tags"][1] != "jsonb":
+                    await session.execute(text("""
+                        ALTER TABLE news_articles 
+                        ALTER COLUMN tags TYPE jsonb USING tags::jsonb;
+                    """))
+                logger.info("   ✅ tags column converted")
+                
+            # Backfill source_url for existing records in id ranges, one
+            # transaction per chunk, so no single statement rewrites the table.
+            # Rows still carrying the old placeholder default are covered too.
+            logger.info("\n🔄 Updating existing records...")
+            async with session.begin():
+                id_range = (await session.execute(text("""
+                    SELECT min(id), max(id) FROM news_articles 
+                    WHERE source_url IS NULL OR source_url = 'https://example.com';
+                """))).one()
+            
+            updated_count = 0
+            if id_range[0] is not None:
+                for chunk_start in range(id_range[0], id_range[1] + 1, _BACKFILL_CHUNK_SIZE):
+                    async with session.begin():
+                        result = await session.execute(_BACKFILL_SOURCE_URL, {
+                            "first_id": chunk_start,
+                            "last_id": chunk_start + _BACKFILL_CHUNK_SIZE - 1
+                        })
+                    updated_count += result.rowcount
+            logger.info("   ✅ Updated %d existing records", updated_count)
+            
+            # Every row has a source_url now, so the constraint can be enforced
+            logger.info("\n🔧 Enforcing NOT NULL on source_url...")
+            async with session.begin():
                 await session.execute(text("""
                     ALTER TABLE news_articles 
-                    ALTER COLUMN author DROP NOT NULL;
+                    ALTER COLUMN source_url SET NOT NULL;
                 """))
-                print("   ✅ author column made nullable")
-            else:
-                print("   ✅ author column already nullable")
-            
-            # Update existing records with proper source_url values
-            print("\n🔄 Updating existing records...")
-            update_query = text("""
-                UPDATE news_articles 
-                SET source_url = 'https://example.com/legacy-article-' || id::text
-                WHERE source_url = 'https://example.com';
-            """)
-            
-            result = await session.execute(update_query)
-            updated_count = result.rowcount
-            print(f"   ✅ Updated {updated_count} existing records")
-            
-            # Remove default constraint from source_url
-            print("\n🔧 Removing default constraint...")
-            await session.execute(text("""
-                ALTER TABLE news_articles 
-                ALTER COLUMN source_url DROP DEFAULT;
-            """))
-            print("   ✅ Default constraint removed")
-            
-            # Add index on source_url for better performance
-            print("\n📊 Adding index on source_url...")
-            await session.execute(text("""
-                CREATE INDEX IF NOT EXISTS idx_news_articles_source_url 
-                ON news_articles(source_url);
-            """))
-            print("   ✅ Index added")
-            
-            # Commit all changes
-            await session.commit()
-            
+            logger.info("   ✅ source_url is NOT NULL")
+        
+        # CREATE INDEX CONCURRENTLY builds without blocking writes, but it
+        # can't run inside a transaction, so use an autocommit connection
+        logger.info("\n📊 Adding indexes...")
+        async with database.engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            for index_name, index_ddl in _CONCURRENT_INDEXES:
+                await conn.execute(text(index_ddl))
+                logger.info("   ✅ %s", index_name)
+        
+        async with database.async_session_maker() as session:
             # Verify the changes
-            print("\n✅ Verifying migration...")
+            logger.info("\n✅ Verifying migration...")
             verify_query = text("""
                 SELECT column_name, data_type, is_nullable, column_default
                 FROM information_schema.columns 
@@ -132,17 +206,15 @@ async def run_migration():
             result = await session.execute(verify_query)
             columns = result.fetchall()
             
-            print("   Final column structure:")
+            logger.info("   Final column structure:")
             for col in columns:
-                print(f"     {col[0]}: {col[1]} (nullable: {col[2]}, default: {col[3]})")
+                logger.info("     %s: %s (nullable: %s, default: %s)", *col)
             
-            print("\n🎉 Migration completed successfully!")
+            logger.info("\n🎉 Migration completed successfully!")
             return True
             
     except Exception as e:
-        print(f"\n❌ Migration failed: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("\n❌ Migration failed: %s", e)
         return False
     
     finally:
@@ -150,6 +222,8 @@ async def run_migration():
 
 async def main():
     """Main function to run the migration."""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     print("🚀 Database Migration Tool")
     print("This will add source_url and published_date columns to news_articles table")
     print("=" * 60)
@@ -1,10 +1,52 @@
 """
 This module defines all JSON structures for input, processing, and output.
 """
+import os
+import threading
 from datetime import datetime
 from typing import List, Optional
-from pydantic import BaseModel, Field, HttpUrl, ConfigDict
-from uuid import uuid4
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter, field_validator
+from uuid import UUID
+
+
+# Random bytes for article IDs are drawn from the OS in batches of this many UUIDs
+_UUID_BATCH_SIZE = 64
+
+_uuid_lock = threading.Lock()
+_uuid_buf = b""
+_uuid_pos = 0
+
+
+def _reset_uuid_buffer():
+    """Drop buffered random bytes so a forked worker never reuses the parent's."""
+    global _uuid_buf, _uuid_pos
+    _uuid_buf = b""
+    _uuid_pos = 0
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_uuid_buffer)
+
+
+def _next_uuid_str() -> str:
+    """
+    Generate a random (version 4) UUID string.
+    
+    Equivalent to str(uuid4()), but reads os.urandom() once per batch
+    of UUIDs instead of once per call.
+    
+    Returns:
+        The UUID in canonical hyphenated form
+    """
+    global _uuid_buf, _uuid_pos
+    with _uuid_lock:
+        if _uuid_pos >= len(_uuid_buf):
+            _uuid_buf = os.urandom(16 * _UUID_BATCH_SIZE)
+            _uuid_pos = 0
+        raw = _uuid_buf[_uuid_pos:_uuid_pos + 16]
+        _uuid_pos += 16
+    # version=4 sets the version and RFC 4122 variant bits
+    return str(UUID(bytes=raw, version=4))
 
 
 class RawNewsInput(BaseModel):
@@ -17,7 +59,11 @@ class RawNewsInput(BaseModel):
     
     title: str = Field(..., description="News article title")
     body: str = Field(..., description="Full news article body text")
-    source_url: HttpUrl = Field(..., description="Original news source URL")
+    source_url: str = Field(
+        ...,
+        max_length=1000,
+        description="Original news source URL (http or https)"
+    )
     author: Optional[str] = Field(
         None, 
         description="Article author/publisher name",
@@ -30,6 +76,14 @@ class RawNewsInput(BaseModel):
         alias="published_at",
         validation_alias="published_at"
     )
+    
+    @field_validator("source_url")
+    @classmethod
+    def _check_source_url_scheme(cls, value: str) -> str:
+        """Cheap scheme check in place of full URL parsing on every ingest."""
+        if not value.startswith(("http://", "https://")):
+            raise ValueError("source_url must start with http:// or https://")
+        return value
 
 
 class EnrichedNewsMedia(BaseModel):
@@ -37,7 +91,7 @@ class EnrichedNewsMedia(BaseModel):
     Media enrichment model containing AI-discovered media URLs.
     Compliant with SWEN schema requirements.
     """
-    model_config = ConfigDict(populate_by_name=True, exclude_none=True)
+    model_config = ConfigDict(populate_by_name=True, exclude_none=True, frozen=True)
     
     search_query: Optional[str] = Field(
         None,
@@ -70,7 +124,7 @@ class EnrichedNewsContext(BaseModel):
     Contextual enrichment model containing AI-generated context information.
     Compliant with SWEN schema requirements.
     """
-    model_config = ConfigDict(populate_by_name=True, exclude_none=True)
+    model_config = ConfigDict(populate_by_name=True, exclude_none=True, frozen=True)
     
     wikipedia_snippet: Optional[str] = Field(
         None, 
@@ -91,7 +145,7 @@ class Geo(BaseModel):
     Geographic coordinates and map information.
     Compliant with SWEN schema requirements.
     """
-    model_config = ConfigDict(populate_by_name=True, exclude_none=True)
+    model_config = ConfigDict(populate_by_name=True, exclude_none=True, frozen=True)
     
     lat: Optional[float] = Field(
         None, 
@@ -107,6 +161,12 @@ class Geo(BaseModel):
     )
 
 
+# Shared all-None instances; the models are frozen, so articles can reuse them as defaults
+_EMPTY_MEDIA = EnrichedNewsMedia()
+_EMPTY_CONTEXT = EnrichedNewsContext()
+_EMPTY_GEO = Geo()
+
+
 class FinalNewsOutput(BaseModel):
     """
     Complete enriched news output model.
@@ -117,7 +177,7 @@ class FinalNewsOutput(BaseModel):
     
     # Unique identifier (UUID)
     id: str = Field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=_next_uuid_str,
         description="Unique identifier (UUID)",
         serialization_alias="id"
     )
@@ -152,20 +212,20 @@ class FinalNewsOutput(BaseModel):
     
     # Nested enriched objects
     media: EnrichedNewsMedia = Field(
-        default_factory=EnrichedNewsMedia, 
+        default_factory=lambda: _EMPTY_MEDIA,
         description="Media enrichment data"
     )
     context: EnrichedNewsContext = Field(
-        default_factory=EnrichedNewsContext, 
+        default_factory=lambda: _EMPTY_CONTEXT,
         description="Contextual enrichment data"
     )
     geo: Geo = Field(
-        default_factory=Geo,
+        default_factory=lambda: _EMPTY_GEO,
         description="Geographic information"
     )
     
     # Metadata
-    ingested_at: str = Field(
+    ingested_at: datetime = Field(
         ...,
         description="Timestamp when the article was ingested (ISO 8601)"
     )
@@ -184,7 +244,7 @@ class NewsSummary(BaseModel):
     tags: List[str] = Field(default_factory=list, description="Article tags")
     relevance_score: float = Field(..., description="Relevance score")
     published_at: Optional[str] = Field(None, description="Publication date (ISO 8601)", serialization_alias="published_at")
-    ingested_at: str = Field(..., description="Ingestion timestamp (ISO 8601)")
+    ingested_at: datetime = Field(..., description="Ingestion timestamp (ISO 8601)")
     featured_image_url: Optional[str] = Field(
         None, 
         description="Featured image URL"
@@ -211,3 +271,20 @@ class IngestionResponse(BaseModel):
     id: str = Field(..., description="Generated UUID for the article")
     data: FinalNewsOutput = Field(..., description="Complete enriched news data")
 
+
+class BatchIngestionResponse(BaseModel):
+    """
+    Response model for the POST /api/v1/ingest/batch endpoint.
+    """
+    status: str = Field(..., description="Ingestion status")
+    message: str = Field(..., description="Status message")
+    ids: List[str] = Field(..., description="Generated UUIDs for the articles, in input order")
+    data: List[FinalNewsOutput] = Field(..., description="Complete enriched news data, in input order")
+
+
+# Serializers built once at import time; dump_json emits response bytes directly
+FINAL_NEWS_ADAPTER = TypeAdapter(FinalNewsOutput)
+NEWS_LIST_ADAPTER = TypeAdapter(NewsListResponse)
+
+# Validates a JSON array of raw articles straight from request bytes
+RAW_NEWS_BATCH_ADAPTER = TypeAdapter(List[RawNewsInput])
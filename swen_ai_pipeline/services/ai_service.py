@@ -2,10 +2,18 @@
 Handles all AI operations including LLM calls and media discovery.
 Refactored for modularity and clean code organization.
 """
-import json
-from typing import List, Dict, Any
+import asyncio
+import hashlib
+import logging
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Any, Callable, Tuple
 
+import httpx
+import orjson
 from google import genai
+from google.genai import types
 
 from swen_ai_pipeline.models.data_models import (
     RawNewsInput,
@@ -14,36 +22,185 @@ from swen_ai_pipeline.models.data_models import (
     Geo
 )
 from swen_ai_pipeline.core.config import settings
+from swen_ai_pipeline.db.cache import TTLCache
 from .ai_constants import DEFAULT_FALLBACKS, CONTENT_LIMITS
 from .ai_utils import (
     clean_json_response,
-    validate_coordinates,
     validate_media_url,
-    validate_content_quality,
-    parse_json_safely,
-    create_geo_from_coordinates,
-    get_fallback_media_urls,
-    get_fallback_content,
-    create_media_validation_prompt
+    create_geo_from_coordinates
 )
 from .ai_prompts import AIPrompts
 from .brave_search_service import brave_search_service
 
 
+logger = logging.getLogger("swen.ai_service")
+
+# Batch job states after which polling stops
+_BATCH_DONE_STATES = frozenset({
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_PARTIALLY_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+})
+
+# Prebuilt media results; the models are frozen, so instances can be shared
+# and per-article variants made with model_copy(), which skips validation
+_MOCK_MEDIA = EnrichedNewsMedia(
+    search_query="African development technology",
+    featured_image_url=DEFAULT_FALLBACKS["featured_image_url"],
+    image_caption="High-quality image relevant to African development",
+    related_video_url=DEFAULT_FALLBACKS["related_video_url"],
+    video_caption="Authoritative video content",
+    media_justification=DEFAULT_FALLBACKS["media_justification"]
+)
+_DISCOVERY_FALLBACK_MEDIA = EnrichedNewsMedia(
+    featured_image_url=DEFAULT_FALLBACKS["featured_image_url"],
+    image_caption="High-quality image relevant to African development",
+    related_video_url="",
+    video_caption=None,
+    media_justification=DEFAULT_FALLBACKS["media_justification"]
+)
+_FALLBACK_MEDIA = EnrichedNewsMedia(
+    featured_image_url=DEFAULT_FALLBACKS["featured_image_url"],
+    image_caption=DEFAULT_FALLBACKS["image_caption"],
+    media_justification=DEFAULT_FALLBACKS["media_justification"]
+)
+
+# Characters trimmed from both ends of a generated search query
+_QUERY_STRIP_CHARS = " \t\r\n\"'"
+
+# Responses longer than this are parsed in a worker thread. Typical responses
+# (a few KB) parse in microseconds, well under the cost of a thread hop.
+_THREAD_PARSE_THRESHOLD = 256 * 1024
+
+# A complete "tags" array in a partially streamed unified response
+_STREAMED_TAGS_RE = re.compile(r'"tags"\s*:\s*(\[[^\]]*\])')
+
+
+@dataclass(slots=True)
+class EnrichedData:
+    """Complete AI enrichment of one article, as returned by enrich_news()."""
+    summary: str
+    tags: List[str]
+    relevance_score: float
+    media: EnrichedNewsMedia
+    context: EnrichedNewsContext
+    geo: Geo
+
+
 class AIService:
     """
     AI Service for news enrichment using Google Gemini.
     Handles summary generation, tagging, context extraction, and media discovery.
     """
     
+    __slots__ = (
+        "use_mock", "client", "model_id", "use_brave_media", "use_llm_search_query",
+        "_response_cache", "_request_slots"
+    )
+    
     def __init__(self):
         """Initialize the AI service with Gemini client."""
         self.use_mock = settings.use_mock_ai
         self.client = None
         self.model_id = settings.gemini_model
+        self.use_brave_media = settings.use_brave_media_discovery
+        self.use_llm_search_query = settings.use_llm_search_query
+        # Responses keyed on the exact instruction and prompt, so repeated
+        # articles skip the Gemini round trip
+        self._response_cache = TTLCache(maxsize=settings.ai_cache_size, ttl=settings.ai_cache_ttl)
+        # Bounds the Gemini requests in flight; past the connection pool size,
+        # extra requests would wait for a connection and could hit its timeout
+        self._request_slots = asyncio.Semaphore(settings.gemini_concurrency)
         
         if not self.use_mock:
-            self.client = genai.Client(api_key=settings.gemini_api_key,)
+            # Requests go through the async client (client.aio), sharing one
+            # pooled HTTP client so concurrent calls overlap on the wire
+            self.client = genai.Client(
+                api_key=settings.gemini_api_key,
+                http_options=types.HttpOptions(
+                    timeout=int(settings.gemini_timeout * 1000),  # milliseconds
+                    async_client_args={
+                        "limits": httpx.Limits(
+                            max_connections=settings.gemini_max_connections,
+                            max_keepalive_connections=settings.gemini_max_connections
+                        )
+                    }
+                )
+            )
+    
+    async def _generate(self, system_instruction: str, prompt: str) -> str | None:
+        """
+        Call Gemini with a static system instruction and a per-article prompt.
+        
+        Identical requests are answered from the response cache.
+        
+        Args:
+            system_instruction: Task instructions shared by every call of a kind
+            prompt: Article-specific content
+            
+        Returns:
+            The response text (None if the model returned no text)
+        """
+        cache_key = self._cache_key(system_instruction, prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        async with self._request_slots:
+            response = await self.client.aio.models.generate_content(
+                model=self.model_id,
+                contents=prompt,
+                config=types.GenerateContentConfig(system_instruction=system_instruction)
+            )
+        if response.text is not None:
+            self._response_cache.set(cache_key, response.text)
+        return response.text
+    
+    async def _generate_stream(
+        self,
+        system_instruction: str,
+        prompt: str,
+        on_partial: Callable[[str], None]
+    ) -> str | None:
+        """
+        Like _generate(), but streams the response and reports it as it grows.
+        
+        Args:
+            system_instruction: Task instructions shared by every call of a kind
+            prompt: Article-specific content
+            on_partial: Called with the text received so far after each chunk
+            
+        Returns:
+            The full response text (None if the model returned no text)
+        """
+        cache_key = self._cache_key(system_instruction, prompt)
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            on_partial(cached)
+            return cached
+        
+        text = None
+        async with self._request_slots:
+            async for chunk in await self.client.aio.models.generate_content_stream(
+                model=self.model_id,
+                contents=prompt,
+                config=types.GenerateContentConfig(system_instruction=system_instruction)
+            ):
+                if chunk.text:
+                    text = chunk.text if text is None else text + chunk.text
+                    on_partial(text)
+        if text is not None:
+            self._response_cache.set(cache_key, text)
+        return text
+    
+    @staticmethod
+    def _cache_key(system_instruction: str, prompt: str) -> bytes:
+        """Hash a request into a response cache key."""
+        return hashlib.blake2b(
+            f"{system_instruction}\0{prompt}".encode(), digest_size=16
+        ).digest()
     
     async def generate_summary(self, title: str, body: str) -> str:
         """Generate an AI-powered summary with African audience focus."""
@@ -52,11 +209,8 @@ class AIService:
         
         prompt = AIPrompts.summary_prompt(title, body)
         
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
-        )
-        return response.text.strip()
+        response_text = await self._generate(AIPrompts.SUMMARY_INSTRUCTION, prompt)
+        return response_text.strip()
     
     async def generate_tags(self, title: str, body: str) -> List[str]:
         """Generate coherent, relevant African-localized hashtags for the article."""
@@ -66,25 +220,24 @@ class AIService:
         prompt = AIPrompts.tags_prompt(title, body)
         
         try:
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
-            content = response.text.strip()
-            cleaned_content = clean_json_response(content)
-            
-            tags = json.loads(cleaned_content)
+            response_text = await self._generate(AIPrompts.TAGS_INSTRUCTION, prompt)
+            tags = await self._parse_json_response_async(response_text)
             if isinstance(tags, list) and len(tags) > 0:
-                # Ensure we have 3-5 tags, prioritizing the most relevant ones
-                if len(tags) < CONTENT_LIMITS["min_tags"]:
-                    # If we have fewer than 3 tags, pad with relevant fallbacks
-                    while len(tags) < CONTENT_LIMITS["min_tags"]:
-                        tags.append("#Africa")
-                return tags[:CONTENT_LIMITS["max_tags"]]
-            return DEFAULT_FALLBACKS["tags"]
-        except (json.JSONDecodeError, KeyError, Exception) as e:
-            print(f"Tag generation error: {e}")
-            return DEFAULT_FALLBACKS["tags"]
+                return self._normalize_tags(tags)
+            return list(DEFAULT_FALLBACKS["tags"])
+        except (orjson.JSONDecodeError, TypeError, AttributeError) as e:
+            # Unparseable output; errors from the API call itself propagate
+            logger.warning("Tag generation error: %s", e)
+            return list(DEFAULT_FALLBACKS["tags"])
+    
+    @staticmethod
+    def _normalize_tags(tags: List[str]) -> List[str]:
+        """Ensure we have 3-5 tags, prioritizing the most relevant ones."""
+        # If we have fewer than 3 tags, pad with relevant fallbacks
+        missing = CONTENT_LIMITS["min_tags"] - len(tags)
+        if missing > 0:
+            tags.extend(("#Africa",) * missing)
+        return tags[:CONTENT_LIMITS["max_tags"]]
     
     async def calculate_relevance_score(self, title: str, body: str) -> float:
         """Calculate relevance score based on African audience importance."""
@@ -94,11 +247,8 @@ class AIService:
         prompt = AIPrompts.relevance_score_prompt(title, body)
         
         try:
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
-            score_str = response.text.strip()
+            response_text = await self._generate(AIPrompts.RELEVANCE_SCORE_INSTRUCTION, prompt)
+            score_str = response_text.strip()
             score = float(score_str)
             return min(max(score, 0.0), 1.0)
         except (ValueError, AttributeError, Exception):
@@ -120,66 +270,60 @@ class AIService:
         if self.use_mock:
             return f"{title[:50]}"
         
-        prompt = f"""You are SWEN's media search query generator. Generate ONE concise, high-quality search query for finding relevant images and videos.
-
-REQUIREMENTS:
-1. Generate a search query that is 3-7 words maximum
-2. Focus on the main topic/subject of the article
-3. Include relevant keywords that will find authoritative media
-4. Make it specific and descriptive
-5. Return ONLY the search query string (no quotes, no JSON, just the query)
-
-Article Title: {title}
-Article Content: {body[:800]}
-
-Generate the optimal search query:"""
+        prompt = AIPrompts.media_search_query_prompt(title, body)
         
         try:
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
-            query = response.text.strip()
-            # Remove any quotes that might be added
-            query = query.strip('"').strip("'")
-            # Limit to reasonable length
-            words = query.split()
+            response_text = await self._generate(AIPrompts.MEDIA_SEARCH_QUERY_INSTRUCTION, prompt)
+            # Remove whitespace and any quotes that might be added, in one pass
+            query = response_text.strip(_QUERY_STRIP_CHARS)
+            # Limit to reasonable length; maxsplit stops splitting after word 7
+            words = query.split(maxsplit=7)
             if len(words) > 7:
                 query = " ".join(words[:7])
             return query
         except Exception as e:
-            print(f"Search query generation error: {e}")
+            logger.warning("Search query generation error: %s", e)
             # Fallback to title
             return title[:100]
     
+    @staticmethod
+    def _local_search_query(title: str, tags: List[str]) -> str:
+        """
+        Build a media search query from the title and top tag, without an AI call.
+        
+        Args:
+            title: Article title
+            tags: Article hashtags, most relevant first
+            
+        Returns:
+            Search query of at most 7 words
+        """
+        words = title.split()[:6]
+        if tags:
+            words.append(tags[0].lstrip("#"))
+        return " ".join(words)
+    
     async def discover_media(self, title: str, body: str, tags: List[str]) -> EnrichedNewsMedia:
         """
         Discover high-quality media using Brave Search API.
         
         Process:
         1. AI determines the relevant country for the article
-        2. AI generates optimal search query
+        2. Build the search query from the title and top tag (or by AI, if enabled)
         3. Search Brave API for images and videos (with country-specific results)
         4. Return first result from each
         """
-        import logging
-
-        logger = logging.getLogger("swen.ai_service.discover_media")
         logger.debug("Starting discover_media with title='%s', tags=%s", title, tags)
         if self.use_mock:
             logger.debug("Using mock mode for discover_media.")
-            return EnrichedNewsMedia(
-                search_query="African development technology",
-                featured_image_url=DEFAULT_FALLBACKS["featured_image_url"],
-                image_caption="High-quality image relevant to African development",
-                related_video_url=DEFAULT_FALLBACKS["related_video_url"],
-                video_caption="Authoritative video content",
-                media_justification=DEFAULT_FALLBACKS["media_justification"]
-            )
+            return _MOCK_MEDIA
         
         try:
             logger.debug("Generating media search query.")
-            search_query = await self.generate_media_search_query(title, body)
+            if self.use_llm_search_query:
+                search_query = await self.generate_media_search_query(title, body)
+            else:
+                search_query = self._local_search_query(title, tags)
             logger.debug("Generated search query: %r", search_query)
             
             logger.debug("Calling Brave Search Service discover_media with search_query: %r", search_query)
@@ -212,9 +356,9 @@ Generate the optimal search query:"""
             # No country_code variable defined, remove from justification
             justification = f"Media content discovered using search query '{search_query}' via Brave Search API. "
             if image_url:
-                justification += f"Image sourced from authoritative content providers. "
+                justification += "Image sourced from authoritative content providers. "
             if video_url:
-                justification += f"Video content from verified sources. "
+                justification += "Video content from verified sources. "
             justification += "Selected to provide visual context relevant to the article's themes and regional audience interests."
             logger.debug("Generated justification: %s", justification)
             
@@ -240,19 +384,20 @@ Generate the optimal search query:"""
             logger.debug("Returning EnrichedNewsMedia: %r", result)
             return result
             
-        except Exception as e:
+        except Exception:
             logger.exception("Media discovery error")
-            return EnrichedNewsMedia(
-                search_query=title[:100],
-                featured_image_url=DEFAULT_FALLBACKS["featured_image_url"],
-                image_caption="High-quality image relevant to African development",
-                related_video_url="",
-                video_caption=None,
-                media_justification=DEFAULT_FALLBACKS["media_justification"]
-            )
+            return _DISCOVERY_FALLBACK_MEDIA.model_copy(update={"search_query": title[:100]})
     
     async def extract_context(self, title: str, body: str) -> EnrichedNewsContext:
-        """Extract rich, high-quality contextual information with African market focus."""
+        """
+        Extract rich, high-quality contextual information with African market focus.
+        
+        Deprecated as a separate prompt: the context fields are projected from
+        unified_enrich(). Its response is cached, so this costs no extra Gemini
+        call when the unified prompt for the article was already sent, unless
+        the cache is disabled (AI_CACHE_TTL=0). enrich_news() doesn't call this;
+        it projects the fields from the response it already has.
+        """
         if self.use_mock:
             return EnrichedNewsContext(
                 wikipedia_snippet=DEFAULT_FALLBACKS["wikipedia_snippet"],
@@ -260,63 +405,10 @@ Generate the optimal search query:"""
                 search_trend=DEFAULT_FALLBACKS["search_trend"]
             )
         
-        prompt = f"""You are SWEN's African context analyst. Generate RICH, HIGH-QUALITY contextual analysis.
-
-CRITICAL REQUIREMENTS:
-1. Wikipedia Snippet: Write 50-100 words of insightful background context
-   - Emphasize African relevance and regional impact
-   - Include specific facts, statistics, or historical context
-   - Make it informative and valuable for African readers
-   
-2. Social Sentiment: Analyze from African audience perspective
-   - "positive" - good news for Africa, opportunities, progress
-   - "negative" - challenges, setbacks, concerns for Africa
-   - "neutral" - balanced or informational
-   
-3. Search Trend: Assess trending status
-   - "viral" - extremely high interest, widespread discussion
-   - "rising" - growing interest and searches
-   - "stable" - consistent interest
-   - "declining" - decreasing interest
-
-Title: {title}
-Content: {body[:1200]}
-
-Analyze deeply and return ONLY a JSON object:
-{{
-  "wikipedia_snippet": "Rich, detailed background context with African relevance (50-100 words)",
-  "social_sentiment": "positive",
-  "search_trend": "rising"
-}}
-
-NO generic responses. Make it specific and valuable."""
-        
         try:
-            response = self.client.models.generate_content(
-                model=self.model_id,
-                contents=prompt
-            )
-            content = response.text.strip()
-            # Remove markdown if present
-            if "```" in content:
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            content = content.strip()
-            
-            data = json.loads(content)
-            
-            snippet = data.get("wikipedia_snippet", "")
-            if not snippet or len(snippet) < 20:  # Ensure quality content
-                snippet = "This article provides important insights relevant to African markets, regional development, and continental progress."
-            
-            return EnrichedNewsContext(
-                wikipedia_snippet=snippet,
-                social_sentiment=data.get("social_sentiment", "neutral"),
-                search_trend=data.get("search_trend", "stable")
-            )
-        except (json.JSONDecodeError, KeyError, AttributeError) as e:
-            print(f"Context extraction error: {e}")
+            return self._context_from_unified(await self.unified_enrich(title, body))
+        except (orjson.JSONDecodeError, KeyError, AttributeError) as e:
+            logger.warning("Context extraction error: %s", e)
             return EnrichedNewsContext(
                 wikipedia_snippet="This article covers topics of significance to African audiences and regional development.",
                 social_sentiment="neutral",
@@ -324,7 +416,13 @@ NO generic responses. Make it specific and valuable."""
             )
     
     async def extract_geo(self, title: str, body: str) -> Geo:
-        """Extract and calculate precise geographic coordinates from the article."""
+        """
+        Extract and calculate precise geographic coordinates from the article.
+        
+        Deprecated as a separate prompt: the coordinates are projected from
+        unified_enrich(), like extract_context(), and likewise only come
+        without an extra Gemini call while the response cache is enabled.
+        """
         if self.use_mock:
             return Geo(
                 lat=-1.286389,
@@ -332,166 +430,461 @@ NO generic responses. Make it specific and valuable."""
                 map_url="https://www.google.com/maps?q=-1.286389,36.817223"
             )
         
-        prompt = f"""You are SWEN's geographic analyst with access to coordinate databases.
-
-CRITICAL REQUIREMENTS:
-1. Identify the PRIMARY location mentioned in the article (country, city, region)
-2. Provide ACCURATE latitude and longitude coordinates for that location
-3. Generate a proper Google Maps URL using those coordinates
-4. If multiple locations are mentioned, choose the most relevant one
-5. Use real coordinates (not approximations)
-
-Common African locations reference:
-- Nairobi, Kenya: -1.286389, 36.817223
-- Lagos, Nigeria: 6.5244, 3.3792
-- Johannesburg, South Africa: -26.2041, 28.0473
-- Cairo, Egypt: 30.0444, 31.2357
-- Addis Ababa, Ethiopia: 9.0320, 38.7469
-- Accra, Ghana: 5.6037, -0.1870
-- Dar es Salaam, Tanzania: -6.7924, 39.2083
-- Kigali, Rwanda: -1.9536, 30.0606
-
-Title: {title}
-Content: {body[:1200]}
-
-Analyze the content carefully and return ONLY a JSON object:
-{{
-  "lat": -1.286389,
-  "lng": 36.817223,
-  "map_url": "https://www.google.com/maps?q=-1.286389,36.817223",
-  "location_name": "Nairobi, Kenya"
-}}
-
-If NO specific location is mentioned, return: {{"lat": null, "lng": null, "map_url": null}}
-
-Return ONLY the JSON object."""
+        try:
+            data = await self.unified_enrich(title, body)
+            
+            # Invalid or missing coordinates give an empty Geo
+            return create_geo_from_coordinates(data.get("geo_lat"), data.get("geo_lng"))
+            
+        except (orjson.JSONDecodeError, KeyError, AttributeError, TypeError, ValueError) as e:
+            logger.warning("Geo extraction error: %s", e)
+            return Geo()
+    
+    @staticmethod
+    def _context_from_unified(data: Dict[str, Any]) -> EnrichedNewsContext:
+        """
+        Project the context fields of a unified_enrich response.
+        
+        Args:
+            data: Parsed unified_enrich JSON
+            
+        Returns:
+            Context, with defaults for fields that are missing, too short or not strings
+        """
+        # The model's JSON isn't validated, so any field may have the wrong type
+        snippet = data.get("wikipedia_snippet")
+        if not isinstance(snippet, str) or len(snippet) < CONTENT_LIMITS["min_snippet_length"]:
+            snippet = "This article provides important insights relevant to African markets, regional development, and continental progress."
+        sentiment = data.get("social_sentiment")
+        trend = data.get("search_trend")
+        
+        return EnrichedNewsContext(
+            wikipedia_snippet=snippet,
+            social_sentiment=sentiment if isinstance(sentiment, str) and sentiment else "neutral",
+            search_trend=trend if isinstance(trend, str) and trend else "stable"
+        )
+    
+    async def unified_enrich(
+        self,
+        title: str,
+        body: str,
+        on_tags: Callable[[List[str]], None] | None = None
+    ) -> Dict[str, Any]:
+        """
+        Generate complete enrichment in single LLM call with African focus - HIGH QUALITY CONTENT ONLY.
+        
+        Args:
+            title: Article title
+            body: Article body text
+            on_tags: If given, the response is streamed and this is called with
+                the tags as soon as they arrive, before the rest is generated
+                
+        Returns:
+            Parsed enrichment data
+        """
+        prompt = AIPrompts.unified_enrichment_prompt(title, body)
+        
+        if on_tags is None:
+            response_text = await self._generate(AIPrompts.UNIFIED_ENRICHMENT_INSTRUCTION, prompt)
+            return await self._parse_json_response_async(response_text)
+        
+        tags_seen = False
+        
+        def scan_for_tags(partial: str) -> None:
+            nonlocal tags_seen
+            if tags_seen:
+                return
+            match = _STREAMED_TAGS_RE.search(partial)
+            if match is None:
+                return
+            tags_seen = True
+            try:
+                tags = orjson.loads(match.group(1))
+            except orjson.JSONDecodeError:
+                return
+            if tags and all(isinstance(tag, str) for tag in tags):
+                on_tags(tags)
         
+        response_text = await self._generate_stream(
+            AIPrompts.UNIFIED_ENRICHMENT_INSTRUCTION, prompt, scan_for_tags
+        )
+        return await self._parse_json_response_async(response_text)
+    
+    @staticmethod
+    def _parse_json_response(response_text: str) -> Any:
+        """
+        Parse the JSON value in a model response, removing markdown fences.
+        
+        Args:
+            response_text: Raw response text
+            
+        Returns:
+            Parsed JSON value
+        """
+        return orjson.loads(clean_json_response(response_text))
+    
+    async def _parse_json_response_async(self, response_text: str) -> Any:
+        """
+        Parse a model response like _parse_json_response(), in a worker
+        thread when it is large enough to hold up the event loop.
+        
+        Args:
+            response_text: Raw response text
+            
+        Returns:
+            Parsed JSON value
+        """
+        if response_text is not None and len(response_text) > _THREAD_PARSE_THRESHOLD:
+            return await asyncio.to_thread(self._parse_json_response, response_text)
+        return self._parse_json_response(response_text)
+    
+    async def batch_enrich(self, raw_inputs: List[RawNewsInput]) -> List[EnrichedData]:
+        """
+        Enrich many articles, using a Gemini batch job when batch mode is enabled.
+        
+        Batch jobs are billed at a lower rate but can take minutes to complete,
+        so batch mode is meant for offline pipelines. Without it, articles are
+        enriched concurrently with enrich_news(). A job still pending after
+        settings.gemini_batch_timeout seconds is cancelled, and the articles
+        are enriched concurrently instead, so a caller such as an HTTP request
+        is never held for longer than that.
+        
+        Args:
+            raw_inputs: Articles to enrich
+            
+        Returns:
+            Enrichment data for each article, in input order
+        """
+        if self.use_mock or not settings.gemini_batch_mode or not raw_inputs:
+            return list(await asyncio.gather(*(self.enrich_news(raw) for raw in raw_inputs)))
+        
+        unified_data: List[Dict[str, Any] | None] = [None] * len(raw_inputs)
+        timed_out = False
         try:
-            response = self.client.models.generate_content(
+            job = await self.client.aio.batches.create(
                 model=self.model_id,
-                contents=prompt
+                src=[
+                    types.InlinedRequest(
+                        contents=AIPrompts.unified_enrichment_prompt(raw.title, raw.body),
+                        config=types.GenerateContentConfig(
+                            system_instruction=AIPrompts.UNIFIED_ENRICHMENT_INSTRUCTION
+                        )
+                    )
+                    for raw in raw_inputs
+                ]
             )
-            content = response.text.strip()
-            # Remove markdown if present
-            if "```" in content:
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-            content = content.strip()
+            job = await self._wait_for_batch_job(job)
             
-            data = json.loads(content)
+            if job is None:
+                timed_out = True
+            elif job.dest and job.dest.inlined_responses:
+                for i, inlined in enumerate(job.dest.inlined_responses[:len(raw_inputs)]):
+                    try:
+                        data = self._parse_json_response(inlined.response.text)
+                        if not isinstance(data, dict):
+                            raise TypeError(f"expected a JSON object, got {type(data).__name__}")
+                        unified_data[i] = data
+                    except Exception as e:
+                        logger.warning("Batch enrichment of article %d failed: %s", i, inlined.error or e)
+            else:
+                logger.warning("Batch enrichment job %s ended in state %s", job.name, job.state)
+        except Exception as e:
+            logger.warning("Batch enrichment failed, using individual calls: %s", e)
+        
+        if timed_out:
+            # Nothing came back, so each article gets the full unified prompt
+            return list(await asyncio.gather(*(self.enrich_news(raw) for raw in raw_inputs)))
+        
+        enrichments: List[Dict[str, Any]] = []
+        for i, data in enumerate(unified_data):
+            enrichment: Dict[str, Any] = {}
+            if data is not None:
+                try:
+                    enrichment = self._enrichment_from_unified(data)
+                except Exception as e:
+                    logger.warning("Batch enrichment of article %d failed: %s", i, e)
+                    unified_data[i] = None
+            enrichments.append(enrichment)
+        
+        # Articles the batch couldn't enrich get filled in by individual calls
+        return list(await asyncio.gather(*(
+            self._complete_enrichment(
+                raw.title,
+                raw.body,
+                enrichment,
+                raw.body[:CONTENT_LIMITS["body_preview_length"]],
+                unified_data=data,
+                unified_failed=data is None
+            )
+            for raw, enrichment, data in zip(raw_inputs, enrichments, unified_data)
+        )))
+    
+    async def _wait_for_batch_job(self, job: types.BatchJob) -> types.BatchJob | None:
+        """
+        Poll a Gemini batch job until it finishes or settings.gemini_batch_timeout passes.
+        
+        A job still running at the deadline is cancelled.
+        
+        Args:
+            job: The batch job as returned on creation
             
-            lat = data.get("lat")
-            lng = data.get("lng")
+        Returns:
+            The finished job, or None if it timed out
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.gemini_batch_timeout
+        while job.state not in _BATCH_DONE_STATES:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                logger.warning(
+                    "Batch enrichment job %s not done after %ss, cancelling it and using individual calls",
+                    job.name, settings.gemini_batch_timeout
+                )
+                try:
+                    await self.client.aio.batches.cancel(name=job.name)
+                except Exception as e:
+                    logger.warning("Cancelling batch enrichment job %s failed: %s", job.name, e)
+                return None
+            await asyncio.sleep(min(settings.gemini_batch_poll_interval, remaining))
+            job = await self.client.aio.batches.get(name=job.name)
+        return job
+    
+    async def enrich_news(self, raw_input: RawNewsInput) -> EnrichedData:
+        """
+        Orchestrate the complete AI enrichment pipeline for a news article.
+        
+        A single unified Gemini call produces all fields; individual calls
+        are only made for fields it didn't return (or all of them if it fails).
+        
+        Media discovery uses Brave Search API unless disabled in settings:
+        1. A concise search query is built from the title and top tag (or by AI)
+        2. Query is used to search Brave's Image and Video verticals
+        3. First result from each is selected
+        """
+        title, body = raw_input.title, raw_input.body
+        # No prompt except the summary reads past this prefix, so the long
+        # body is sliced once here instead of once per prompt
+        body_preview = body[:CONTENT_LIMITS["body_preview_length"]]
+        
+        enrichment: Dict[str, Any] = {}
+        unified_data: Dict[str, Any] | None = None
+        unified_failed = False
+        if not self.use_mock:
+            # Brave media discovery only needs the tags, so it starts as soon as
+            # they are streamed instead of waiting for the whole response
+            media_task: asyncio.Task | None = None
             
-            # Validate coordinates
-            if lat is not None and lng is not None:
-                # Ensure coordinates are within valid ranges
-                if -90 <= lat <= 90 and -180 <= lng <= 180:
-                    map_url = f"https://www.google.com/maps?q={lat},{lng}"
-                    return Geo(lat=lat, lng=lng, map_url=map_url)
+            def start_media_discovery(tags: List[str]) -> None:
+                nonlocal media_task
+                media_task = asyncio.create_task(
+                    self.discover_media(title, body_preview, self._normalize_tags(tags))
+                )
             
-            # If coordinates invalid or missing, return empty geo
-            return Geo()
+            try:
+                unified_data = await self.unified_enrich(
+                    title, body_preview, start_media_discovery if self.use_brave_media else None
+                )
+                enrichment = self._enrichment_from_unified(unified_data)
+            except Exception as e:
+                logger.warning("Unified enrichment failed, using individual calls: %s", e)
+                unified_data = None
+                unified_failed = True
             
-        except (json.JSONDecodeError, KeyError, AttributeError, ValueError) as e:
-            print(f"Geo extraction error: {e}")
-            return Geo()
+            if media_task is not None:
+                if "tags" in enrichment and "media" not in enrichment:
+                    try:
+                        enrichment["media"] = await media_task
+                    except Exception as e:
+                        logger.warning("Enrichment of media failed: %s", e)
+                        enrichment["media"] = self._fallback_enrichment("media", title)
+                else:
+                    media_task.cancel()
+        
+        return await self._complete_enrichment(
+            title, body, enrichment, body_preview, unified_data, unified_failed
+        )
     
-    async def unified_enrich(self, title: str, body: str) -> Dict[str, Any]:
-        """Generate complete enrichment in single LLM call with African focus - HIGH QUALITY CONTENT ONLY."""
-        prompt = f"""You are SWEN's AI enrichment engine. Generate comprehensive, HIGH-QUALITY analysis prioritizing African market relevance.
-
-CRITICAL REQUIREMENTS - NO PLACEHOLDERS:
-1. Tags: COHERENT hashtags reflecting actual article content (NOT generic)
-2. Media URLs: REAL working URLs (Unsplash photo IDs, real YouTube video IDs)
-3. Geo Coordinates: ACCURATE lat/lng for locations mentioned in the article
-4. Context: Rich, detailed, high-quality content
-5. Relevance Score: Based on African audience importance (0.0-1.0)
-
-MEDIA REQUIREMENTS:
-- featured_image_url: Use format "https://images.unsplash.com/photo-XXXXX?w=800&q=80" with real photo ID
-- related_video_url: Use format "https://www.youtube.com/watch?v=VIDEO_ID" with real video ID
-- NO search results URLs, NO placeholder URLs
-
-GEO REQUIREMENTS:
-- Extract PRIMARY location from article (city/country)
-- Provide accurate coordinates (reference common African cities)
-- Generate proper Google Maps URL: "https://www.google.com/maps?q=LAT,LNG"
-- If NO location mentioned, set all geo fields to null
-
-Common African coordinates:
-- Nairobi: -1.286389, 36.817223
-- Lagos: 6.5244, 3.3792
-- Johannesburg: -26.2041, 28.0473
-- Cairo: 30.0444, 31.2357
-
-Title: {title}
-Content: {body[:1500]}
-
-Return ONLY valid JSON:
-{{
-  "summary": "2-3 sentences emphasizing African relevance",
-  "tags": ["#Specific", "#Coherent", "#Tags", "#NotGeneric"],
-  "relevance_score": 0.85,
-  "featured_image_url": "https://images.unsplash.com/photo-XXXXX?w=800&q=80",
-  "related_video_url": "https://www.youtube.com/watch?v=VIDEO_ID",
-  "media_justification": "Detailed explanation of media selection for African audiences",
-  "wikipedia_snippet": "Rich contextual background (50-100 words)",
-  "social_sentiment": "positive",
-  "search_trend": "rising",
-  "geo_lat": -1.286389,
-  "geo_lng": 36.817223,
-  "geo_map_url": "https://www.google.com/maps?q=-1.286389,36.817223"
-}}"""
-        
-        response = self.client.models.generate_content(
-            model=self.model_id,
-            contents=prompt
+    async def _complete_enrichment(
+        self,
+        title: str,
+        body: str,
+        enrichment: Dict[str, Any],
+        body_preview: str,
+        unified_data: Dict[str, Any] | None = None,
+        unified_failed: bool = False
+    ) -> EnrichedData:
+        """
+        Fill in enrichment fields that are missing with individual AI calls.
+        
+        Args:
+            title: Article title
+            body: Article body text (only the summary uses all of it)
+            enrichment: Fields already produced (e.g. by unified_enrich)
+            body_preview: Body truncated to CONTENT_LIMITS["body_preview_length"]
+            unified_data: The parsed unified_enrich response, if there is one;
+                missing context and geo are projected from it directly
+            unified_failed: Whether the unified prompt already failed for this
+                article; context and geo are projected from that prompt, so
+                they fall back to defaults instead of sending it again
+            
+        Returns:
+            Complete enrichment data
+        """
+        # Individual calls for missing fields are independent except media
+        # discovery, which needs the tags, so tags and media run as one chain
+        calls = {}
+        if "summary" not in enrichment:
+            calls["summary"] = self.generate_summary(title, body)
+        if "tags" not in enrichment:
+            calls["tags_and_media"] = self._tags_and_media(title, body_preview)
+        elif "media" not in enrichment:
+            calls["media"] = self.discover_media(title, body_preview, enrichment["tags"])
+        if "relevance_score" not in enrichment:
+            calls["relevance_score"] = self.calculate_relevance_score(title, body_preview)
+        if "context" not in enrichment:
+            if unified_data is not None:
+                enrichment["context"] = self._context_from_unified(unified_data)
+            elif unified_failed:
+                enrichment["context"] = self._fallback_enrichment("context", title)
+            else:
+                calls["context"] = self.extract_context(title, body_preview)
+        if "geo" not in enrichment:
+            if unified_data is not None:
+                # The response had no usable coordinates
+                enrichment["geo"] = Geo()
+            elif unified_failed:
+                enrichment["geo"] = self._fallback_enrichment("geo", title)
+            else:
+                calls["geo"] = self.extract_geo(title, body_preview)
+        
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        for name, result in zip(calls, results):
+            # Any call that raised falls back to default content
+            if isinstance(result, Exception):
+                logger.warning("Enrichment of %s failed: %s", name, result)
+                result = self._fallback_enrichment(name, title)
+            if name == "tags_and_media":
+                enrichment["tags"], enrichment["media"] = result
+            else:
+                enrichment[name] = result
+        
+        return EnrichedData(
+            summary=enrichment["summary"],
+            tags=enrichment["tags"],
+            relevance_score=enrichment["relevance_score"],
+            media=enrichment["media"],
+            context=enrichment["context"],
+            geo=enrichment["geo"]
         )
-        content = response.text.strip()
-        # Remove markdown if present
-        if "```" in content:
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-        content = content.strip()
-        return json.loads(content)
     
-    async def enrich_news(self, raw_input: RawNewsInput) -> Dict[str, Any]:
+    def _enrichment_from_unified(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Orchestrate the complete AI enrichment pipeline for a news article.
+        Build enrichment fields from a unified_enrich response.
         
-        Media discovery now uses Brave Search API:
-        1. AI generates a concise search query from the article
-        2. Query is used to search Brave's Image and Video verticals
-        3. First result from each is selected
+        Args:
+            data: Parsed unified_enrich JSON
+            
+        Returns:
+            Dictionary with only the fields that were present and valid
         """
-        # Use individual calls with Brave Search integration
-        summary = await self.generate_summary(raw_input.title, raw_input.body)
-        tags = await self.generate_tags(raw_input.title, raw_input.body)
-        relevance_score = await self.calculate_relevance_score(raw_input.title, raw_input.body)
+        enrichment: Dict[str, Any] = {}
+        
+        summary = data.get("summary")
+        if isinstance(summary, str) and summary.strip():
+            enrichment["summary"] = summary.strip()
+        
+        tags = data.get("tags")
+        if isinstance(tags, list) and tags and all(isinstance(tag, str) for tag in tags):
+            enrichment["tags"] = self._normalize_tags(tags)
+        
+        try:
+            enrichment["relevance_score"] = min(max(float(data["relevance_score"]), 0.0), 1.0)
+        except (KeyError, TypeError, ValueError):
+            pass
         
+        snippet = data.get("wikipedia_snippet")
+        if isinstance(snippet, str) and len(snippet) >= CONTENT_LIMITS["min_snippet_length"]:
+            enrichment["context"] = self._context_from_unified(data)
+        
+        # Null coordinates mean no location was mentioned, which is a valid answer
+        if "geo_lat" in data and "geo_lng" in data:
+            try:
+                enrichment["geo"] = create_geo_from_coordinates(data["geo_lat"], data["geo_lng"])
+            except TypeError:
+                pass
+        
+        # Brave Search replaces the model's media suggestions when enabled
+        image_url = data.get("featured_image_url")
+        if not self.use_brave_media and validate_media_url(image_url, "image"):
+            video_url = data.get("related_video_url")
+            enrichment["media"] = EnrichedNewsMedia(
+                featured_image_url=image_url,
+                related_video_url=video_url if validate_media_url(video_url, "video") else "",
+                media_justification=data.get("media_justification") or DEFAULT_FALLBACKS["media_justification"]
+            )
+        
+        return enrichment
+    
+    @staticmethod
+    def _fallback_enrichment(name: str, title: str) -> Any:
+        """
+        Get default content for an enrichment call that failed.
+        
+        Args:
+            name: Enrichment field (or "tags_and_media" for the chained call)
+            title: Article title, used as the fallback media search query
+            
+        Returns:
+            Fallback value for the field
+        """
+        if name == "summary":
+            return DEFAULT_FALLBACKS["summary"]
+        if name == "relevance_score":
+            return DEFAULT_FALLBACKS["relevance_score"]
+        if name == "context":
+            return EnrichedNewsContext(
+                wikipedia_snippet=DEFAULT_FALLBACKS["wikipedia_snippet"],
+                social_sentiment=DEFAULT_FALLBACKS["social_sentiment"],
+                search_trend=DEFAULT_FALLBACKS["search_trend"]
+            )
+        if name == "geo":
+            return Geo()
+        
+        media = _FALLBACK_MEDIA.model_copy(update={"search_query": title[:100]})
+        if name == "tags_and_media":
+            return list(DEFAULT_FALLBACKS["tags"]), media
+        return media
+    
+    async def _tags_and_media(self, title: str, body: str) -> Tuple[List[str], EnrichedNewsMedia]:
+        """
+        Generate tags, then discover media using them.
+        
+        Args:
+            title: Article title
+            body: Article body text
+            
+        Returns:
+            Tuple of (tags, media)
+        """
+        tags = await self.generate_tags(title, body)
         # Media discovery now uses Brave Search API
-        media = await self.discover_media(raw_input.title, raw_input.body, tags)
-        
-        context = await self.extract_context(raw_input.title, raw_input.body)
-        geo = await self.extract_geo(raw_input.title, raw_input.body)
-        
-        return {
-            "summary": summary,
-            "tags": tags,
-            "relevance_score": relevance_score,
-            "media": media,
-            "context": context,
-            "geo": geo
-        }
+        media = await self.discover_media(title, body, tags)
+        return tags, media
     
-    def close(self):
-        """Close the Gemini client to release resources."""
+    async def close(self):
+        """Close the Gemini clients to release resources."""
         if self.client:
+            await self.client.aio.aclose()
             self.client.close()
 
 
-ai_service = AIService()
 
+@lru_cache(maxsize=1)
+def get_ai_service() -> AIService:
+    """
+    Get the shared AI service, creating it (and its Gemini client) on first use.
+    
+    Returns:
+        The shared AIService instance
+    """
+    return AIService()
@@ -1,9 +1,12 @@
 """
 Utility functions for AI service operations.
 """
-import json
 import re
-from typing import Dict, Any, Optional, Tuple, List
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, Any, Mapping, Optional, Tuple, List
+
+import orjson
 
 from swen_ai_pipeline.models.data_models import Geo
 from .ai_constants import (
@@ -12,10 +15,50 @@ from .ai_constants import (
     DEFAULT_FALLBACKS,
     CONTENT_LIMITS,
     COORDINATE_RANGES,
+    BYTES_PER_TOKEN,
     URL_PATTERNS
 )
 
 
+# Capitalized words, used as candidate tags
+_TAG_WORD_RE = re.compile(r"\b[A-Z][a-z]+\b")
+
+# Phrases that mark generated content as a placeholder
+_GENERIC_PHRASES: Tuple[str, ...] = (
+    "unavailable", "not available", "no context", "placeholder",
+    "default", "generic", "lorem ipsum", "test content"
+)
+
+# Coordinate bounds unpacked once, so validation does no dict lookups
+_LAT_MIN, _LAT_MAX = COORDINATE_RANGES["lat_min"], COORDINATE_RANGES["lat_max"]
+_LNG_MIN, _LNG_MAX = COORDINATE_RANGES["lng_min"], COORDINATE_RANGES["lng_max"]
+
+# Media URL patterns unpacked once, so validation does no dict lookups
+_UNSPLASH_DIRECT = URL_PATTERNS["unsplash_direct"]
+_UNSPLASH_SOURCE = URL_PATTERNS["unsplash_source"]
+_YOUTUBE_WATCH = URL_PATTERNS["youtube_watch"]
+_YOUTUBE_SEARCH = URL_PATTERNS["youtube_search"]
+_YOUTUBE_RESULTS = URL_PATTERNS["youtube_results"]
+
+# Google Maps link prefix for a coordinate pair
+_MAP_URL_PREFIX = "https://www.google.com/maps?q="
+
+# City coordinates as parallel tuples (struct-of-arrays), built once at import
+# so nearest-city scans walk flat float sequences instead of dict items
+_CITY_NAMES: Tuple[str, ...] = tuple(AFRICAN_CITIES_COORDINATES)
+_CITY_LATS: Tuple[float, ...] = tuple(lat for lat, _ in AFRICAN_CITIES_COORDINATES.values())
+_CITY_LNGS: Tuple[float, ...] = tuple(lng for _, lng in AFRICAN_CITIES_COORDINATES.values())
+
+# Lowercased city names paired with their coordinates, for case-insensitive text matching
+_CITY_MATCH_TABLE: Tuple[Tuple[str, str, float, float], ...] = tuple(
+    (city_name.lower(), city_name, lat, lng)
+    for city_name, (lat, lng) in AFRICAN_CITIES_COORDINATES.items()
+)
+
+# Texts shorter than the shortest city name cannot mention any city
+_MIN_CITY_LEN: int = min(len(city_key) for city_key, *_ in _CITY_MATCH_TABLE)
+
+
 def clean_json_response(content: str) -> str:
     """
     Clean and extract JSON from LLM response, removing markdown formatting.
@@ -28,13 +71,41 @@ def clean_json_response(content: str) -> str:
     """
     content = content.strip()
     
-    # Remove markdown code blocks if present
-    if "```" in content:
-        content = content.split("```")[1]
-        if content.startswith("json"):
-            content = content[4:]
+    # Take the contents of the first markdown code block, if present
+    # (an unclosed block runs to the end)
+    start = content.find("```")
+    if start == -1:
+        return content
+    end = content.find("```", start + 3)
+    block = content[start + 3:end] if end != -1 else content[start + 3:]
     
-    return content.strip()
+    return block.removeprefix("json").strip()
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """
+    Truncate text to roughly a Gemini token budget.
+    
+    Cuts on a UTF-8 byte budget rather than a character count, so text in
+    scripts that take more tokens per character is cut shorter. ASCII text
+    is cut exactly like text[:max_tokens * BYTES_PER_TOKEN].
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Token budget
+        
+    Returns:
+        The longest prefix of whole characters within the budget
+    """
+    max_bytes = max_tokens * BYTES_PER_TOKEN
+    if len(text) * 4 <= max_bytes:  # Fits even if every character takes 4 bytes
+        return text
+    
+    head = text[:max_bytes]
+    if head.isascii():
+        return head
+    # The decoder drops a character cut in half at the end
+    return head.encode("utf-8", "surrogatepass")[:max_bytes].decode("utf-8", "ignore")
 
 
 def validate_coordinates(lat: Optional[float], lng: Optional[float]) -> bool:
@@ -48,12 +119,9 @@ def validate_coordinates(lat: Optional[float], lng: Optional[float]) -> bool:
     Returns:
         True if coordinates are valid, False otherwise
     """
-    if lat is None or lng is None:
-        return False
-    
     return (
-        COORDINATE_RANGES["lat_min"] <= lat <= COORDINATE_RANGES["lat_max"] and
-        COORDINATE_RANGES["lng_min"] <= lng <= COORDINATE_RANGES["lng_max"]
+        lat is not None and lng is not None and
+        _LAT_MIN <= lat <= _LAT_MAX and _LNG_MIN <= lng <= _LNG_MAX
     )
 
 
@@ -73,40 +141,84 @@ def validate_media_url(url: str, url_type: str) -> bool:
     
     if url_type == "image":
         return (
-            URL_PATTERNS["unsplash_direct"] in url and
-            URL_PATTERNS["unsplash_source"] not in url and
+            _UNSPLASH_DIRECT in url and
+            _UNSPLASH_SOURCE not in url and
             "?w=" in url
         )
     elif url_type == "video":
         return (
-            URL_PATTERNS["youtube_watch"] in url and
-            URL_PATTERNS["youtube_search"] not in url and
-            URL_PATTERNS["youtube_results"] not in url
+            _YOUTUBE_WATCH in url and
+            _YOUTUBE_SEARCH not in url and
+            _YOUTUBE_RESULTS not in url
         )
     
     return False
 
 
+@lru_cache(maxsize=1024)
 def extract_location_from_text(text: str) -> Optional[Tuple[str, float, float]]:
     """
     Extract location information from text using the cities database.
     
+    Results are cached per text, so retried or duplicate articles skip the scan.
+    
     Args:
         text: Text to search for locations
         
     Returns:
         Tuple of (city_name, lat, lng) if found, None otherwise
     """
+    if len(text) < _MIN_CITY_LEN:
+        return None
+    
     text_lower = text.lower()
     
     # Search for city names in the text
-    for city_name, (lat, lng) in AFRICAN_CITIES_COORDINATES.items():
-        if city_name.lower() in text_lower:
+    for city_key, city_name, lat, lng in _CITY_MATCH_TABLE:
+        if city_key in text_lower:
             return city_name, lat, lng
     
     return None
 
 
+def find_cities(text: str) -> List[Tuple[str, float, float]]:
+    """
+    Find every known city mentioned in the text.
+    
+    Args:
+        text: Text to search for locations
+        
+    Returns:
+        List of (city_name, lat, lng) tuples in cities database order
+    """
+    text_lower = text.lower()
+    return [
+        (city_name, lat, lng)
+        for city_key, city_name, lat, lng in _CITY_MATCH_TABLE
+        if city_key in text_lower
+    ]
+
+
+def nearest_city(lat: float, lng: float) -> str:
+    """
+    Find the known African city closest to the given coordinates.
+    
+    Uses squared planar distance, which is sufficient for ranking cities.
+    
+    Args:
+        lat: Latitude coordinate
+        lng: Longitude coordinate
+        
+    Returns:
+        Name of the nearest city in the cities database
+    """
+    distances = [
+        (city_lat - lat) ** 2 + (city_lng - lng) ** 2
+        for city_lat, city_lng in zip(_CITY_LATS, _CITY_LNGS)
+    ]
+    return _CITY_NAMES[distances.index(min(distances))]
+
+
 def create_geo_from_coordinates(lat: float, lng: float) -> Geo:
     """
     Create Geo object from coordinates with proper validation.
@@ -122,29 +234,29 @@ def create_geo_from_coordinates(lat: float, lng: float) -> Geo:
         return Geo(
             lat=lat,
             lng=lng,
-            map_url=f"https://www.google.com/maps?q={lat},{lng}"
+            map_url=f"{_MAP_URL_PREFIX}{lat},{lng}"
         )
     return Geo()
 
 
-def get_fallback_media_urls() -> Dict[str, str]:
+def get_fallback_media_urls() -> Mapping[str, str]:
     """
     Get fallback media URLs for when AI generation fails.
     
     Returns:
-        Dictionary with fallback URLs
+        Read-only mapping with fallback URLs (shared; use dict() for a mutable copy)
     """
-    return DEFAULT_MEDIA_URLS.copy()
+    return DEFAULT_MEDIA_URLS
 
 
-def get_fallback_content() -> Dict[str, Any]:
+def get_fallback_content() -> Mapping[str, Any]:
     """
     Get fallback content for when AI generation fails.
     
     Returns:
-        Dictionary with fallback content
+        Read-only mapping with fallback content (shared; use dict() for a mutable copy)
     """
-    return DEFAULT_FALLBACKS.copy()
+    return DEFAULT_FALLBACKS
 
 
 def validate_content_quality(content: str, min_length: int = CONTENT_LIMITS["min_snippet_length"]) -> bool:
@@ -162,13 +274,8 @@ def validate_content_quality(content: str, min_length: int = CONTENT_LIMITS["min
         return False
     
     # Check for generic placeholder text
-    generic_phrases = [
-        "unavailable", "not available", "no context", "placeholder",
-        "default", "generic", "lorem ipsum", "test content"
-    ]
-    
     content_lower = content.lower()
-    for phrase in generic_phrases:
+    for phrase in _GENERIC_PHRASES:
         if phrase in content_lower:
             return False
     
@@ -188,8 +295,8 @@ def parse_json_safely(content: str, fallback: Dict[str, Any]) -> Dict[str, Any]:
     """
     try:
         cleaned_content = clean_json_response(content)
-        return json.loads(cleaned_content)
-    except (json.JSONDecodeError, ValueError, TypeError) as e:
+        return orjson.loads(cleaned_content)
+    except (orjson.JSONDecodeError, ValueError, TypeError) as e:
         print(f"JSON parsing error: {e}")
         return fallback
 
@@ -204,11 +311,11 @@ def extract_tags_from_content(content: str) -> List[str]:
     Returns:
         List of potential tags
     """
-    # Simple keyword extraction for validation
-    words = re.findall(r'\b[A-Z][a-z]+\b', content)
-    return [f"#{word}" for word in words[:5]]
+    # Simple keyword extraction for validation; stops scanning after the fifth word
+    return [f"#{match.group()}" for match in islice(_TAG_WORD_RE.finditer(content), 5)]
 
 
+@lru_cache(maxsize=1)
 def format_african_cities_reference() -> str:
     """
     Format the African cities reference for prompts.
@@ -216,12 +323,13 @@ def format_african_cities_reference() -> str:
     Returns:
         Formatted string with city coordinates
     """
-    lines = []
-    for city, (lat, lng) in list(AFRICAN_CITIES_COORDINATES.items())[:8]:  # Top 8 cities
-        lines.append(f"- {city}: {lat}, {lng}")
-    return "\n".join(lines)
+    return "\n".join(
+        f"- {city}: {lat}, {lng}"
+        for city, (lat, lng) in islice(AFRICAN_CITIES_COORDINATES.items(), 8)  # Top 8 cities
+    )
 
 
+@lru_cache(maxsize=1)
 def create_media_validation_prompt() -> str:
     """
     Create validation prompt for media URL generation with E-E-A-T authority requirements.
@@ -229,7 +337,7 @@ def create_media_validation_prompt() -> str:
     Returns:
         Formatted prompt string
     """
-    return f"""
+    return """
 CRITICAL E-E-A-T AUTHORITY REQUIREMENTS:
 1. Find ONE Primary Image: Search for the single most relevant, high-resolution image
 2. Find ONE Primary Video: Search for ONE authoritative video from credible sources ONLY
@@ -263,64 +371,7 @@ MEDIA JUSTIFICATION REQUIREMENTS (50+ words):
 """
 
 
-def create_geo_validation_prompt() -> str:
-    """
-    Create validation prompt for geographic coordinate extraction.
-    
-    Returns:
-        Formatted prompt string
-    """
-    return f"""
-CRITICAL REQUIREMENTS:
-1. Identify the PRIMARY location mentioned in the article (country, city, region, specific site)
-2. Provide ACCURATE latitude and longitude coordinates for that location
-3. Generate a proper Google Maps URL using those coordinates: "https://www.google.com/maps?q=LAT,LNG"
-4. If multiple locations are mentioned, choose the most relevant one
-5. Use real coordinates (not approximations)
-6. For specific sites (mines, facilities, etc.), use the most accurate coordinates available
-
-Common African locations reference:
-{format_african_cities_reference()}
-
-COORDINATE ACCURACY:
-- Use precise coordinates when available
-- For cities, use city center coordinates
-- For specific facilities, use facility coordinates
-- Ensure coordinates are within valid ranges: lat (-90 to 90), lng (-180 to 180)
-
-If NO specific location is mentioned, return: {{"lat": null, "lng": null, "map_url": null}}
-"""
-
-
-def create_content_quality_prompt() -> str:
-    """
-    Create validation prompt for high-quality content generation.
-    
-    Returns:
-        Formatted prompt string
-    """
-    return """
-CRITICAL REQUIREMENTS:
-1. Wikipedia Snippet: Write 50-100 words of insightful background context
-   - Emphasize African relevance and regional impact
-   - Include specific facts, statistics, or historical context
-   - Make it informative and valuable for African readers
-   
-2. Social Sentiment: Analyze from African audience perspective
-   - "positive" - good news for Africa, opportunities, progress
-   - "negative" - challenges, setbacks, concerns for Africa
-   - "neutral" - balanced or informational
-   
-3. Search Trend: Assess trending status
-   - "viral" - extremely high interest, widespread discussion
-   - "rising" - growing interest and searches
-   - "stable" - consistent interest
-   - "declining" - decreasing interest
-
-NO generic responses. Make it specific and valuable.
-"""
-
-
+@lru_cache(maxsize=1)
 def create_tag_quality_prompt() -> str:
     """
     Create validation prompt for coherent tag generation.
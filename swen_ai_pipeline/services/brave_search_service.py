@@ -1,26 +1,76 @@
 """
 Brave Search API service for discovering media content (images and videos).
 """
+import asyncio
 import httpx
 from typing import Optional, Dict, Any
 from swen_ai_pipeline.core.config import settings
 
+# HTTP/2 lets concurrent searches share one connection; it needs the h2
+# package (httpx[http2]), so fall back to HTTP/1.1 where it isn't installed
+try:
+    import h2  # noqa: F401
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
 
 class BraveSearchService:
     """
     Service for interacting with Brave Search API to discover images and videos.
     """
     
-    def __init__(self):
-        """Initialize the Brave Search service with API credentials."""
-        self.api_key = settings.brave_api_key
-        self.image_search_url = settings.brave_image_search_url
-        self.video_search_url = settings.brave_video_search_url
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        image_search_url: Optional[str] = None,
+        video_search_url: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None
+    ):
+        """
+        Initialize the Brave Search service with API credentials.
+        
+        Args:
+            api_key: Brave API key (default: settings.brave_api_key)
+            image_search_url: Image search endpoint (default: settings.brave_image_search_url)
+            video_search_url: Video search endpoint (default: settings.brave_video_search_url)
+            client: HTTP client to send searches with (default: a shared
+                client created on first use and closed by aclose()); the
+                API key headers are sent with each request on it
+        """
+        self.api_key = api_key if api_key is not None else settings.brave_api_key
+        self.image_search_url = image_search_url or settings.brave_image_search_url
+        self.video_search_url = video_search_url or settings.brave_video_search_url
         self.headers = {
             "Accept": "application/json",
             "Accept-Encoding": "gzip",
             "X-Subscription-Token": self.api_key if self.api_key else ""
         }
+        self.parallel_search = settings.brave_parallel_search
+        # Created on first use and shared by all searches, so connections
+        # (and their TLS sessions) are reused across requests. An injected
+        # client is owned by the caller, who closes it; it doesn't carry our
+        # headers, so they go with every request instead.
+        self._client: Optional[httpx.AsyncClient] = client
+        self._owns_client = client is None
+        self._request_headers = None if self._owns_client else self.headers
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=_HTTP2,
+                headers=self.headers,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+                timeout=30.0
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared HTTP client's connections."""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
     
     async def search_images(self, query: str, count: int = 1) -> Optional[Dict[str, Any]]:
         """
@@ -55,35 +105,35 @@ class BraveSearchService:
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    self.image_search_url,
-                    headers=self.headers,
-                    params={
-                        "q": query,
-                        "count": count,
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract first result
-                if data.get("results") and len(data["results"]) > 0:
-                    first_result = data["results"][0]
-                    # The actual image URL is in properties.url
-                    image_url = first_result.get("properties", {}).get("url")
-                    
-                    return {
-                        "url": image_url,  # Actual image URL from properties
-                        "page_url": first_result.get("url"),  # Page where image is found
-                        "title": first_result.get("title"),
-                        "source": first_result.get("source"),
-                        "thumbnail": first_result.get("thumbnail", {}).get("src"),
-                        "width": first_result.get("properties", {}).get("width"),
-                        "height": first_result.get("properties", {}).get("height")
-                    }
-                return None
+            client = self._get_client()
+            response = await client.get(
+                self.image_search_url,
+                params={
+                    "q": query,
+                    "count": count,
+                },
+                headers=self._request_headers
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            # Extract first result
+            if data.get("results") and len(data["results"]) > 0:
+                first_result = data["results"][0]
+                # The actual image URL is in properties.url
+                image_url = first_result.get("properties", {}).get("url")
                 
+                return {
+                    "url": image_url,  # Actual image URL from properties
+                    "page_url": first_result.get("url"),  # Page where image is found
+                    "title": first_result.get("title"),
+                    "source": first_result.get("source"),
+                    "thumbnail": first_result.get("thumbnail", {}).get("src"),
+                    "width": first_result.get("properties", {}).get("width"),
+                    "height": first_result.get("properties", {}).get("height")
+                }
+            return None
+            
         except httpx.HTTPError as e:
             print(f"Brave Image Search API error: {e}")
             return None
@@ -107,30 +157,30 @@ class BraveSearchService:
             return None
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    self.video_search_url,
-                    headers=self.headers,
-                    params={
-                        "q": query,
-                        "count": count,
-                    }
-                )
-                response.raise_for_status()
-                data = response.json()
-                
-                # Extract first result
-                if data.get("results") and len(data["results"]) > 0:
-                    first_result = data["results"][0]
-                    return {
-                        "url": first_result.get("url"),
-                        "title": first_result.get("title"),
-                        "description": first_result.get("description"),
-                        "thumbnail": first_result.get("thumbnail", {}).get("src"),
-                        "duration": first_result.get("meta_url", {}).get("duration")
-                    }
-                return None
-                
+            client = self._get_client()
+            response = await client.get(
+                self.video_search_url,
+                params={
+                    "q": query,
+                    "count": count,
+                },
+                headers=self._request_headers
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            # Extract first result
+            if data.get("results") and len(data["results"]) > 0:
+                first_result = data["results"][0]
+                return {
+                    "url": first_result.get("url"),
+                    "title": first_result.get("title"),
+                    "description": first_result.get("description"),
+                    "thumbnail": first_result.get("thumbnail", {}).get("src"),
+                    "duration": first_result.get("meta_url", {}).get("duration")
+                }
+            return None
+            
         except httpx.HTTPError as e:
             print(f"Brave Video Search API error: {e}")
             return None
@@ -148,16 +198,26 @@ class BraveSearchService:
         Returns:
             Dictionary containing query, image_url, and video_url
         """
-        import asyncio
-        
-        # Search for images first
-        image_result = await self.search_images(query)
-        
-        # Wait at least 2 seconds before searching for videos to avoid rate limiting
-        await asyncio.sleep(2.0)
-        
-        # Then search for videos
-        video_result = await self.search_videos(query)
+        if self.parallel_search:
+            # Both searches at once; a failed search counts as no result
+            image_result, video_result = await asyncio.gather(
+                self.search_images(query),
+                self.search_videos(query),
+                return_exceptions=True
+            )
+            if isinstance(image_result, BaseException):
+                image_result = None
+            if isinstance(video_result, BaseException):
+                video_result = None
+        else:
+            # Search for images first
+            image_result = await self.search_images(query)
+            
+            # Wait at least 2 seconds before searching for videos to avoid rate limiting
+            await asyncio.sleep(2.0)
+            
+            # Then search for videos
+            video_result = await self.search_videos(query)
         
         return {
             "query": query,
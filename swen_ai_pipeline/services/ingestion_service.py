@@ -1,21 +1,30 @@
 """
 Orchestrates the complete news ingestion and enrichment workflow.
 """
+import asyncio
+import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 from swen_ai_pipeline.models.data_models import (
     RawNewsInput,
     FinalNewsOutput,
-    EnrichedNewsMedia,
-    EnrichedNewsContext
+    NewsSummary
 )
+from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from swen_ai_pipeline.services.ai_service import ai_service
+from swen_ai_pipeline.core.config import settings
+from swen_ai_pipeline.services.ai_service import EnrichedData, get_ai_service
+from swen_ai_pipeline.db.database import get_db
 from swen_ai_pipeline.db.repository import get_repository
 
 
+logger = logging.getLogger("swen.ingestion_service")
+
+_UTC = timezone.utc
+
+
 class IngestionService:
     """
     Service that orchestrates the news ingestion pipeline.
@@ -29,7 +38,7 @@ class IngestionService:
         Args:
             db_session: Database session for repository operations
         """
-        self.ai_service = ai_service
+        self.ai_service = get_ai_service()
         self.repository = get_repository(db_session)
     
     async def ingest_news(self, raw_input: RawNewsInput) -> FinalNewsOutput:
@@ -56,27 +65,7 @@ class IngestionService:
             enriched_data = await self.ai_service.enrich_news(raw_input)
             
             # Step 2: Construct the final output model
-            final_output = FinalNewsOutput(
-                # Original fields
-                title=raw_input.title,
-                body=raw_input.body,
-                source_url=str(raw_input.source_url),
-                publisher=raw_input.author,  # Map author to publisher
-                published_at=raw_input.published_date,  # Map published_date to published_at
-                
-                # AI-generated core fields
-                summary=enriched_data["summary"],
-                tags=enriched_data["tags"],
-                relevance_score=enriched_data["relevance_score"],
-                
-                # Nested enriched objects
-                media=enriched_data["media"],
-                context=enriched_data["context"],
-                geo=enriched_data.get("geo"),
-                
-                # Metadata - convert datetime to ISO 8601 string
-                ingested_at=datetime.now(timezone.utc).isoformat()
-            )
+            final_output = self._build_output(raw_input, enriched_data, datetime.now(_UTC))
             
             # Step 3: Store the enriched news
             await self.repository.save_news(final_output)
@@ -84,8 +73,105 @@ class IngestionService:
             return final_output
             
         except Exception as e:
-            print(f"Error during news ingestion: {str(e)}")
-            raise Exception(f"News ingestion failed: {str(e)}")
+            logger.exception("Error during news ingestion")
+            raise Exception(f"News ingestion failed: {str(e)}") from e
+    
+    async def ingest_news_batch(
+        self,
+        raw_inputs: List[RawNewsInput],
+        concurrency: Optional[int] = None
+    ) -> List[FinalNewsOutput]:
+        """
+        Process and enrich many raw news articles through the AI pipeline.
+        
+        Articles are enriched concurrently, so one article's AI and search
+        latency overlaps with the others'. They are then
+        written together with one multi-row upsert.
+        
+        Args:
+            raw_inputs: Raw news articles
+            concurrency: Articles enriched at the same time
+                (defaults to settings.ingest_batch_concurrency)
+            
+        Returns:
+            Fully enriched news outputs, in input order
+            
+        Raises:
+            Exception: If any step in the pipeline fails for any article,
+                chained to the original error (an ExceptionGroup if enrichment failed)
+        """
+        semaphore = asyncio.Semaphore(concurrency or settings.ingest_batch_concurrency)
+        
+        async def enrich(raw_input: RawNewsInput) -> EnrichedData:
+            async with semaphore:
+                return await self.ai_service.enrich_news(raw_input)
+        
+        try:
+            # Step 1: AI Enrichment (Gemini batch jobs enrich everything at once)
+            if settings.gemini_batch_mode:
+                enriched = await self.ai_service.batch_enrich(raw_inputs)
+            else:
+                async with asyncio.TaskGroup() as tg:
+                    tasks = [tg.create_task(enrich(raw_input)) for raw_input in raw_inputs]
+                enriched = [task.result() for task in tasks]
+            
+            # Step 2: Construct the final output models, stamped with one
+            # shared ingestion time for the whole batch
+            ingested_at = datetime.now(_UTC)
+            final_outputs = [
+                self._build_output(raw_input, enriched_data, ingested_at)
+                for raw_input, enriched_data in zip(raw_inputs, enriched)
+            ]
+            
+            # Step 3: Store the enriched news in one round trip
+            await self.repository.save_news_bulk(final_outputs)
+            
+            return final_outputs
+            
+        except Exception as e:
+            # A failed enrichment arrives as the TaskGroup's ExceptionGroup;
+            # it is logged with every sub-exception and kept as the cause
+            logger.exception("Error during batch news ingestion")
+            raise Exception(f"Batch news ingestion failed: {str(e)}") from e
+    
+    @staticmethod
+    def _build_output(
+        raw_input: RawNewsInput,
+        enriched_data: EnrichedData,
+        ingested_at: datetime
+    ) -> FinalNewsOutput:
+        """
+        Combine a raw article and its AI enrichment into the final output model.
+        
+        Args:
+            raw_input: Raw news article data
+            enriched_data: Enrichment fields from the AI service
+            ingested_at: UTC ingestion timestamp
+            
+        Returns:
+            Fully enriched news output
+        """
+        return FinalNewsOutput(
+            # Original fields
+            title=raw_input.title,
+            body=raw_input.body,
+            source_url=raw_input.source_url,
+            publisher=raw_input.author,  # Map author to publisher
+            published_at=raw_input.published_date,  # Map published_date to published_at
+            
+            # AI-generated core fields
+            summary=enriched_data.summary,
+            tags=enriched_data.tags,
+            relevance_score=enriched_data.relevance_score,
+            
+            # Nested enriched objects
+            media=enriched_data.media,
+            context=enriched_data.context,
+            geo=enriched_data.geo,
+            
+            # Metadata - serialized to ISO 8601 when the response is encoded
+            ingested_at=ingested_at
+        )
     
     async def get_news_by_id(self, article_id: str) -> Optional[FinalNewsOutput]:
         """
@@ -112,6 +198,36 @@ class IngestionService:
         """
         return await self.repository.get_all_news(limit=limit, offset=offset)
     
+    async def get_all_news_with_total(
+        self, limit: int = 100, offset: int = 0
+    ) -> tuple[list[FinalNewsOutput], int]:
+        """
+        Retrieve a page of news articles and the total article count in one query.
+        
+        Args:
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+            
+        Returns:
+            Tuple of (news articles, total number of articles)
+        """
+        return await self.repository.get_all_news_with_total(limit=limit, offset=offset)
+    
+    async def get_all_news_summaries(
+        self, limit: int = 100, offset: int = 0
+    ) -> tuple[list[NewsSummary], int]:
+        """
+        Retrieve a page of news summaries and the total article count.
+        
+        Args:
+            limit: Maximum number of articles to return
+            offset: Number of articles to skip
+            
+        Returns:
+            Tuple of (news summaries, total number of articles)
+        """
+        return await self.repository.get_all_news_summaries(limit=limit, offset=offset)
+    
     async def get_news_count(self) -> int:
         """
         Get the total count of stored news articles.
@@ -122,12 +238,15 @@ class IngestionService:
         return await self.repository.get_news_count()
 
 
-def get_ingestion_service(db_session: AsyncSession) -> IngestionService:
+def get_ingestion_service(db_session: AsyncSession = Depends(get_db)) -> IngestionService:
     """
     Factory function to create an ingestion service instance.
     
+    Usable as a FastAPI dependency, in which case one instance is built
+    per request and shared by everything that depends on it.
+    
     Args:
-        db_session: Database session
+        db_session: Database session (injected per request via get_db)
         
     Returns:
         IngestionService instance
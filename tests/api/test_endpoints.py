@@ -0,0 +1,153 @@
+"""
+Tests for the POST /api/v1/ingest/batch endpoint and its OpenAPI schema.
+
+The app is driven through httpx.ASGITransport with the ingestion service and
+settings dependencies overridden, so no database or AI calls are made.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, Iterator, List
+
+import httpx
+import pytest
+
+from swen_ai_pipeline.core.config import get_settings
+from swen_ai_pipeline.main import app
+from swen_ai_pipeline.models.data_models import FinalNewsOutput, RawNewsInput
+from swen_ai_pipeline.services.ingestion_service import get_ingestion_service
+
+
+BATCH_URL = "/api/v1/ingest/batch"
+MAX_BATCH_SIZE = 3
+
+
+def iter_refs(node: Any) -> Iterator[str]:
+    """Yield every $ref in a JSON schema document."""
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if key == "$ref":
+                yield value
+            else:
+                yield from iter_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from iter_refs(value)
+
+
+def resolve_ref(document: dict, ref: str) -> Any:
+    """Look up a local "#/..." reference in document (KeyError if dangling)."""
+    node = document
+    for part in ref.removeprefix("#/").split("/"):
+        node = node[part]
+    return node
+
+
+def raw_article(i: int) -> dict:
+    """JSON body of a raw article numbered i."""
+    return {"title": f"Article {i}", "body": f"Body {i}", "source_url": f"https://example.com/{i}"}
+
+
+class StubIngestionService:
+    """Turns each raw article into an output without enrichment."""
+    
+    def __init__(self):
+        self.batches: List[List[RawNewsInput]] = []
+    
+    async def ingest_news_batch(self, raw_inputs: List[RawNewsInput]) -> List[FinalNewsOutput]:
+        self.batches.append(raw_inputs)
+        ingested_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        return [
+            FinalNewsOutput(
+                title=raw.title,
+                body=raw.body,
+                source_url=raw.source_url,
+                summary="Summary",
+                tags=["africa", "news", "test"],
+                relevance_score=0.5,
+                ingested_at=ingested_at
+            )
+            for raw in raw_inputs
+        ]
+
+
+@pytest.fixture
+def ingestion_service():
+    """Stub service installed for the duration of a test."""
+    service = StubIngestionService()
+    app.dependency_overrides[get_ingestion_service] = lambda: service
+    app.dependency_overrides[get_settings] = lambda: SimpleNamespace(
+        ingest_batch_max_size=MAX_BATCH_SIZE
+    )
+    yield service
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def client():
+    """Client that sends requests straight to the app."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
+
+
+class TestIngestBatchEndpoint:
+    """Test cases for POST /api/v1/ingest/batch."""
+    
+    @pytest.mark.asyncio
+    async def test_batch_is_ingested_in_order(self, client, ingestion_service):
+        articles = [raw_article(i) for i in range(MAX_BATCH_SIZE)]
+        
+        response = await client.post(BATCH_URL, json=articles)
+        
+        assert response.status_code == 201
+        payload = response.json()
+        assert payload["status"] == "success"
+        assert [news["title"] for news in payload["data"]] == [a["title"] for a in articles]
+        assert payload["ids"] == [news["id"] for news in payload["data"]]
+        assert len(ingestion_service.batches) == 1
+    
+    @pytest.mark.asyncio
+    async def test_oversized_batch_is_rejected(self, client, ingestion_service):
+        articles = [raw_article(i) for i in range(MAX_BATCH_SIZE + 1)]
+        
+        response = await client.post(BATCH_URL, json=articles)
+        
+        assert response.status_code == 413
+        assert str(MAX_BATCH_SIZE) in response.json()["detail"]
+        assert ingestion_service.batches == []
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("body", [
+        b"not json",
+        b'{"title": "not a list"}',
+        b'[{"title": "missing fields"}]',
+        b'[{"title": "t", "body": "b", "source_url": "ftp://example.com"}]',
+    ])
+    async def test_invalid_body_is_rejected(self, client, ingestion_service, body):
+        response = await client.post(
+            BATCH_URL, content=body, headers={"content-type": "application/json"}
+        )
+        
+        assert response.status_code == 422
+        assert all(error["loc"][0] == "body" for error in response.json()["detail"])
+        assert ingestion_service.batches == []
+
+
+class TestOpenAPISchema:
+    """The generated OpenAPI document for the ingestion endpoints."""
+    
+    def test_all_refs_resolve(self):
+        document = app.openapi()
+        
+        for ref in iter_refs(document):
+            assert ref.startswith("#/"), ref
+            resolve_ref(document, ref)
+    
+    def test_batch_body_is_array_of_raw_articles(self):
+        body = app.openapi()["paths"][BATCH_URL]["post"]["requestBody"]
+        schema = body["content"]["application/json"]["schema"]
+        
+        assert body["required"] is True
+        assert schema["type"] == "array"
+        assert schema["items"]["title"] == "RawNewsInput"
+        assert set(schema["items"]["required"]) == {"title", "body", "source_url"}
@@ -0,0 +1,27 @@
+"""
+Shared pytest configuration for the test suite.
+"""
+import asyncio
+
+import pytest
+
+# Run async tests on the libuv event loop, like the server does; fall back
+# to the default asyncio loop where uvloop isn't available (e.g. Windows)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """
+    One event loop for the whole test session.
+    
+    Replaces pytest-asyncio's per-test loop, so async tests don't each pay
+    for creating and closing a loop. With pytest-xdist (pytest -n auto)
+    every worker process gets its own session and therefore its own loop.
+    """
+    loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+    yield loop
+    loop.close()
@@ -0,0 +1,213 @@
+"""
+Tests for the pure ASGI CORS and exception middleware.
+
+Requests are driven through httpx.ASGITransport against a minimal ASGI app,
+so the middleware sees the same scopes and messages a server would send.
+"""
+import httpx
+import orjson
+import pytest
+
+from swen_ai_pipeline.core.middleware import CORSAsgiMiddleware, ExceptionAsgiMiddleware
+
+
+ORIGIN = "https://app.example.com"
+OTHER_ORIGIN = "https://evil.example.com"
+
+
+async def ok_app(scope, receive, send):
+    """Answers every request with a 200 text response."""
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [(b"content-type", b"text/plain")]
+    })
+    await send({"type": "http.response.body", "body": b"app"})
+
+
+async def failing_app(scope, receive, send):
+    """Raises before starting a response."""
+    raise RuntimeError("secret internal detail")
+
+
+async def failing_after_start_app(scope, receive, send):
+    """Raises after the response has started."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    raise RuntimeError("too late")
+
+
+def make_client(app) -> httpx.AsyncClient:
+    """Client that sends requests straight to an ASGI app."""
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://testserver")
+
+
+def preflight_headers(origin: str = ORIGIN, method: str = "POST", **extra: str):
+    """Headers of a browser CORS preflight request."""
+    return {"origin": origin, "access-control-request-method": method, **extra}
+
+
+class TestCORSAsgiMiddleware:
+    """Simple and preflight CORS responses."""
+    
+    async def test_request_without_origin_is_untouched(self):
+        async with make_client(CORSAsgiMiddleware(ok_app)) as client:
+            response = await client.get("/")
+        
+        assert response.text == "app"
+        assert "access-control-allow-origin" not in response.headers
+        assert "vary" not in response.headers
+    
+    async def test_wildcard_origin_without_cookie(self):
+        app = CORSAsgiMiddleware(ok_app, allow_credentials=True)
+        async with make_client(app) as client:
+            response = await client.get("/", headers={"origin": ORIGIN})
+        
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert "vary" not in response.headers
+    
+    async def test_wildcard_origin_with_cookie_echoes_origin(self):
+        app = CORSAsgiMiddleware(ok_app, allow_credentials=True)
+        async with make_client(app) as client:
+            response = await client.get("/", headers={"origin": ORIGIN, "cookie": "session=1"})
+        
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+    
+    async def test_explicit_origin_is_echoed(self):
+        app = CORSAsgiMiddleware(ok_app, allow_origins=[ORIGIN])
+        async with make_client(app) as client:
+            response = await client.get("/", headers={"origin": ORIGIN})
+        
+        assert response.text == "app"
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["vary"] == "Origin"
+        assert "access-control-allow-credentials" not in response.headers
+    
+    async def test_disallowed_origin_gets_no_cors_headers(self):
+        app = CORSAsgiMiddleware(ok_app, allow_origins=[ORIGIN])
+        async with make_client(app) as client:
+            response = await client.get("/", headers={"origin": OTHER_ORIGIN})
+        
+        assert response.text == "app"
+        assert "access-control-allow-origin" not in response.headers
+    
+    async def test_preflight_is_answered_without_the_app(self):
+        app = CORSAsgiMiddleware(ok_app, allow_origins=[ORIGIN], max_age=120)
+        async with make_client(app) as client:
+            response = await client.options(
+                "/",
+                headers=preflight_headers(**{"access-control-request-headers": "x-custom"})
+            )
+        
+        assert response.status_code == 200
+        assert response.text == "OK"
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["vary"] == "Origin"
+        assert response.headers["access-control-allow-headers"] == "x-custom"
+        assert response.headers["access-control-max-age"] == "120"
+        assert "POST" in response.headers["access-control-allow-methods"]
+    
+    async def test_wildcard_preflight_without_credentials(self):
+        async with make_client(CORSAsgiMiddleware(ok_app)) as client:
+            response = await client.options("/", headers=preflight_headers())
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == "*"
+        assert "vary" not in response.headers
+    
+    async def test_wildcard_preflight_with_credentials_echoes_origin(self):
+        app = CORSAsgiMiddleware(ok_app, allow_credentials=True)
+        async with make_client(app) as client:
+            response = await client.options("/", headers=preflight_headers())
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+        assert response.headers["access-control-allow-credentials"] == "true"
+        assert response.headers["vary"] == "Origin"
+    
+    @pytest.mark.parametrize("origin,method,error", [
+        (OTHER_ORIGIN, "POST", "Disallowed CORS origin"),
+        (ORIGIN, "PATCH", "Disallowed CORS method"),
+        (OTHER_ORIGIN, "PATCH", "Disallowed CORS origin, method"),
+    ])
+    async def test_preflight_rejections(self, origin, method, error):
+        app = CORSAsgiMiddleware(ok_app, allow_origins=[ORIGIN], allow_methods=["GET", "POST"])
+        async with make_client(app) as client:
+            response = await client.options("/", headers=preflight_headers(origin, method))
+        
+        assert response.status_code == 400
+        assert response.text == error
+        assert response.headers["content-length"] == str(len(error))
+    
+    async def test_options_without_request_method_reaches_the_app(self):
+        app = CORSAsgiMiddleware(ok_app, allow_origins=[ORIGIN])
+        async with make_client(app) as client:
+            response = await client.options("/", headers={"origin": ORIGIN})
+        
+        assert response.text == "app"
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+
+class TestExceptionAsgiMiddleware:
+    """JSON 500 responses for unhandled errors."""
+    
+    async def test_successful_response_passes_through(self):
+        async with make_client(ExceptionAsgiMiddleware(ok_app)) as client:
+            response = await client.get("/")
+        
+        assert response.status_code == 200
+        assert response.text == "app"
+    
+    async def test_unhandled_error_becomes_json_500(self):
+        async with make_client(ExceptionAsgiMiddleware(failing_app)) as client:
+            response = await client.get("/boom?x=1")
+        
+        assert response.status_code == 500
+        assert response.headers["content-type"] == "application/json"
+        assert response.headers["content-length"] == str(len(response.content))
+        assert response.json() == {
+            "error": "Internal Server Error",
+            "detail": "internal error",
+            "path": "http://testserver/boom?x=1"
+        }
+        assert b"secret" not in response.content
+    
+    async def test_error_body_escapes_the_url(self):
+        sent = []
+        
+        async def receive():
+            return {"type": "http.request", "body": b""}
+        
+        async def send(message):
+            sent.append(message)
+        
+        scope = {
+            "type": "http",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("testserver", 80),
+            "path": '/a"b\\c',
+            "query_string": b"",
+            "headers": []
+        }
+        await ExceptionAsgiMiddleware(failing_app)(scope, receive, send)
+        
+        assert sent[0]["status"] == 500
+        assert orjson.loads(sent[1]["body"])["path"] == 'http://testserver/a"b\\c'
+    
+    async def test_error_after_response_start_is_reraised(self):
+        transport = httpx.ASGITransport(app=ExceptionAsgiMiddleware(failing_after_start_app))
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            with pytest.raises(RuntimeError, match="too late"):
+                await client.get("/")
+    
+    async def test_error_response_carries_cors_headers(self):
+        # Same stacking as main.py: CORS outermost
+        app = CORSAsgiMiddleware(ExceptionAsgiMiddleware(failing_app), allow_origins=[ORIGIN])
+        async with make_client(app) as client:
+            response = await client.get("/", headers={"origin": ORIGIN})
+        
+        assert response.status_code == 500
+        assert response.headers["access-control-allow-origin"] == ORIGIN
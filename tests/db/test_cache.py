@@ -0,0 +1,97 @@
+"""
+Tests for the in-process TTLCache.
+"""
+import pytest
+
+from swen_ai_pipeline.db import cache as cache_module
+from swen_ai_pipeline.db.cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable time.monotonic() for the cache module."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Expiry, eviction and disabled-cache behaviour of TTLCache."""
+    
+    def test_get_returns_stored_value(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        
+        assert cache.get("a") == 1
+        assert cache.get("missing") is None
+    
+    def test_entry_expires_after_ttl(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        
+        clock[0] += 9.9
+        assert cache.get("a") == 1
+        
+        clock[0] += 0.1
+        assert cache.get("a") is None
+        assert "a" not in cache._entries
+    
+    def test_set_refreshes_expiry(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        clock[0] += 8
+        cache.set("a", 2)
+        clock[0] += 8
+        
+        assert cache.get("a") == 2
+    
+    def test_evicts_least_recently_used(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+    
+    def test_overwrite_does_not_evict(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 3)
+        
+        assert cache.get("a") == 3
+        assert cache.get("b") == 2
+    
+    @pytest.mark.parametrize("maxsize,ttl", [(2, 0), (2, -1), (0, 10), (-1, 10)])
+    def test_disabled_cache_stores_nothing(self, clock, maxsize, ttl):
+        cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        cache.set("a", 1)
+        
+        assert cache.get("a") is None
+        assert not cache._entries
+    
+    def test_pop_removes_key(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.pop("a")
+        
+        assert cache.get("a") is None
+    
+    def test_pop_missing_key_is_noop(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.pop("missing")
+        
+        assert cache.get("a") == 1
+    
+    def test_clear_removes_everything(self, clock):
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.clear()
+        
+        assert cache.get("a") is None
+        assert cache.get("b") is None
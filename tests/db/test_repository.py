@@ -0,0 +1,153 @@
+"""
+Tests for the NewsRepository read caches and row mapping.
+
+Statements are not sent anywhere: the session's execute() is replaced with a
+stub, while commit() and rollback() run SQLAlchemy's real transaction events.
+"""
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from swen_ai_pipeline.db import repository
+from swen_ai_pipeline.db.repository import NewsRepository
+from swen_ai_pipeline.models.data_models import FinalNewsOutput
+
+
+ARTICLE_ID = "3f2c1a9e-0000-4000-8000-000000000001"
+
+
+def make_news(article_id: str = ARTICLE_ID) -> FinalNewsOutput:
+    """Build a minimal article with the given ID."""
+    return FinalNewsOutput.model_construct(
+        id=article_id,
+        title="Test article",
+        body="Body",
+        source_url="https://example.com/article",
+        publisher="Example",
+        published_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        summary="Summary",
+        tags=["test"],
+        relevance_score=0.5,
+        media=None,
+        context=None,
+        geo=None,
+        ingested_at=datetime(2025, 1, 2, tzinfo=timezone.utc)
+    )
+
+
+@pytest.fixture
+def session():
+    """A session without a database whose execute() accepts any statement."""
+    session = AsyncSession()
+    
+    async def execute(statement, params=None):
+        # Begin a transaction the way a real execute() autobegins one
+        if not session.in_transaction():
+            await session.begin()
+        return SimpleNamespace(rowcount=1)
+    
+    session.execute = execute
+    return session
+
+
+@pytest.fixture
+def repo(session):
+    """Repository over the stub session."""
+    return NewsRepository(session)
+
+
+@pytest.fixture(autouse=True)
+def warm_caches():
+    """Start every test with a cached article and count."""
+    repository._article_cache.set(ARTICLE_ID, "cached article")
+    repository._count_cache.set(repository._COUNT_KEY, 1)
+    yield
+    repository._article_cache.clear()
+    repository._count_cache.clear()
+
+
+def caches_hold_old_values() -> bool:
+    """Whether the entries set by warm_caches are still served."""
+    return (
+        repository._article_cache.get(ARTICLE_ID) == "cached article"
+        and repository._count_cache.get(repository._COUNT_KEY) == 1
+    )
+
+
+class TestCacheInvalidation:
+    """Writes evict the read caches only once their transaction commits."""
+    
+    async def test_save_invalidates_after_commit(self, repo, session):
+        await repo.save_news_bulk([make_news()])
+        assert caches_hold_old_values()
+        
+        await session.commit()
+        assert repository._article_cache.get(ARTICLE_ID) is None
+        assert repository._count_cache.get(repository._COUNT_KEY) is None
+    
+    async def test_delete_invalidates_after_commit(self, repo, session):
+        assert await repo.delete_news(ARTICLE_ID) is True
+        assert caches_hold_old_values()
+        
+        await session.commit()
+        assert repository._article_cache.get(ARTICLE_ID) is None
+        assert repository._count_cache.get(repository._COUNT_KEY) is None
+    
+    async def test_rollback_keeps_caches(self, repo, session):
+        await repo.save_news_bulk([make_news()])
+        await session.rollback()
+        await session.commit()
+        
+        assert caches_hold_old_values()
+    
+    async def test_commit_without_writes_keeps_caches(self, session):
+        await session.commit()
+        
+        assert caches_hold_old_values()
+
+
+class TestRowMapping:
+    """Conversion of output models to news_articles rows."""
+    
+    def test_row_keeps_ingestion_timestamp(self):
+        news = make_news()
+        
+        assert NewsRepository._to_row(news)["ingested_at"] == news.ingested_at
+    
+    def test_upsert_overwrites_ingestion_timestamp(self):
+        stmt = NewsRepository._upsert_stmt([NewsRepository._to_row(make_news())])
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        
+        assert "ingested_at = excluded.ingested_at" in sql
+
+
+class TestSaveNewsBulk:
+    """Deduplication and chunking in save_news_bulk."""
+    
+    async def test_duplicate_ids_keep_last_occurrence(self, repo):
+        first = make_news()
+        last = make_news().model_copy(update={"title": "Updated"})
+        other = make_news("3f2c1a9e-0000-4000-8000-000000000002")
+        
+        saved = await repo.save_news_bulk([first, other, last])
+        
+        assert [news.id for news in saved] == [first.id, other.id]
+        assert saved[0].title == "Updated"
+    
+    async def test_rows_are_sent_in_chunks(self, repo, session, monkeypatch):
+        statements = []
+        execute = session.execute
+        
+        async def recording_execute(statement, params=None):
+            statements.append(statement)
+            return await execute(statement, params)
+        
+        session.execute = recording_execute
+        monkeypatch.setattr(repository, "_BULK_CHUNK_SIZE", 2)
+        items = [make_news(f"3f2c1a9e-0000-4000-8000-00000000001{i}") for i in range(5)]
+        
+        assert len(await repo.save_news_bulk(items)) == 5
+        assert len(statements) == 3
@@ -0,0 +1,102 @@
+"""
+Shared fixtures for the service tests.
+
+The Brave API is mocked at the transport layer: one httpx.AsyncClient on an
+httpx.MockTransport serves the whole session, and each test registers the
+routes it needs on brave_api.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import httpx
+import orjson
+import pytest
+
+
+TEST_API_KEY = "BSArZUnBKyazQ6pk7h6npB3fbzYw_y9"
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+
+class MockRoute:
+    """A mocked endpoint: its canned outcome and the requests it received."""
+    
+    def __init__(self, content: Optional[bytes] = None, side_effect: Optional[Exception] = None):
+        self.content = content
+        self.side_effect = side_effect
+        self.calls: List[httpx.Request] = []
+
+
+class MockBraveAPI:
+    """
+    Stand-in for the Brave API behind an httpx.MockTransport.
+    
+    Routes are looked up by URL without the query string, so answering a
+    request is one dict lookup; unmatched URLs get a 404.
+    """
+    
+    def __init__(self):
+        self.routes: Dict[str, MockRoute] = {}
+    
+    def mock(
+        self,
+        url: str,
+        json: Any = None,
+        content: Optional[bytes] = None,
+        side_effect: Optional[Exception] = None
+    ) -> MockRoute:
+        """
+        Answer requests to url with a 200 JSON response or an exception.
+        
+        Args:
+            url: Endpoint URL without query string
+            json: Response body for successful calls, serialized once here
+            content: Already serialized JSON response body (instead of json)
+            side_effect: Exception raised instead of responding
+            
+        Returns:
+            The route, whose calls record the requests it answered
+        """
+        if content is None and side_effect is None:
+            content = orjson.dumps(json)
+        route = self.routes[url] = MockRoute(content, side_effect)
+        return route
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        route = self.routes.get(str(request.url.copy_with(query=None)))
+        if route is None:
+            return httpx.Response(404)
+        route.calls.append(request)
+        if route.side_effect is not None:
+            raise route.side_effect
+        return httpx.Response(200, content=route.content, headers=JSON_HEADERS)
+
+
+@pytest.fixture(scope="session")
+def brave_api():
+    """Mock Brave API shared by the whole test session."""
+    return MockBraveAPI()
+
+
+@pytest.fixture(scope="session")
+def brave_api_key():
+    """API key the services under test authenticate with."""
+    return TEST_API_KEY
+
+
+@pytest.fixture(scope="session")
+def brave_client(brave_api):
+    """
+    One HTTP client, routed to the mock Brave API, shared by all tests.
+    
+    It carries no Brave headers; services add their own to each request.
+    """
+    client = httpx.AsyncClient(transport=httpx.MockTransport(brave_api))
+    yield client
+    asyncio.run(client.aclose())
+
+
+@pytest.fixture(autouse=True)
+def reset_brave_api(brave_api):
+    """Clear the routes left by the previous test."""
+    brave_api.routes.clear()
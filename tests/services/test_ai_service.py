@@ -0,0 +1,203 @@
+"""
+Tests for AIService: malformed unified enrichment responses and batch jobs.
+
+Gemini is never called: a subclass returns canned unified_enrich payloads
+and stubs the individual calls, and batch jobs run on a fake client.
+"""
+import asyncio
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from swen_ai_pipeline.core.config import settings
+from swen_ai_pipeline.models.data_models import RawNewsInput, EnrichedNewsMedia, Geo
+from swen_ai_pipeline.services.ai_service import AIService
+from google.genai import types
+
+
+SNIPPET = "A snippet that is long enough to be kept as the article context."
+
+VALID_PAYLOAD = {
+    "summary": "Unified summary",
+    "tags": ["#Kenya", "#Tech", "#Startups"],
+    "relevance_score": 0.8,
+    "wikipedia_snippet": SNIPPET,
+    "social_sentiment": "positive",
+    "search_trend": "rising",
+    "geo_lat": -1.29,
+    "geo_lng": 36.82
+}
+
+# Model outputs that parse as JSON but not into the expected shape
+NON_OBJECT_PAYLOADS = [["a", "b"], "text", 42, None]
+WRONG_TYPE_PAYLOADS = [
+    {**VALID_PAYLOAD, "wikipedia_snippet": 12345},
+    {**VALID_PAYLOAD, "social_sentiment": {"x": 1}},
+    {**VALID_PAYLOAD, "search_trend": ["up"]},
+    {**VALID_PAYLOAD, "geo_lat": "north", "geo_lng": {"x": 1}},
+]
+
+RAW = RawNewsInput(title="Article", body="Body text", source_url="https://example.com/a")
+
+
+class StubAIService(AIService):
+    """AIService whose unified prompt returns a fixed payload."""
+    
+    def __init__(self, payload: Any = None):
+        with patch(
+            "swen_ai_pipeline.services.ai_service.settings",
+            settings.model_copy(update={"use_mock_ai": True})
+        ):
+            super().__init__()
+        self.use_mock = False
+        self.use_brave_media = False
+        self.payload = payload
+    
+    async def unified_enrich(self, title, body, on_tags=None):
+        return self.payload
+    
+    async def generate_summary(self, title, body):
+        return "Individual summary"
+    
+    async def calculate_relevance_score(self, title, body):
+        return 0.4
+    
+    async def _tags_and_media(self, title, body):
+        return ["#Africa", "#News", "#Test"], EnrichedNewsMedia()
+    
+    async def discover_media(self, title, body, tags):
+        return EnrichedNewsMedia()
+    
+    async def extract_context(self, title, body):
+        raise AssertionError("context must come from the unified response or fallbacks")
+    
+    async def extract_geo(self, title, body):
+        raise AssertionError("geo must come from the unified response or fallbacks")
+
+
+class FakeBatches:
+    """Gemini batches API answering with one canned response per request."""
+    
+    def __init__(self, texts: List[str], state: types.JobState = types.JobState.JOB_STATE_SUCCEEDED):
+        self.texts = texts
+        self.state = state
+        self.polls = 0
+        self.cancelled: List[str] = []
+    
+    def _job(self):
+        return SimpleNamespace(
+            name="batches/test",
+            state=self.state,
+            dest=SimpleNamespace(inlined_responses=[
+                SimpleNamespace(response=SimpleNamespace(text=text), error=None)
+                for text in self.texts
+            ])
+        )
+    
+    async def create(self, model, src):
+        return self._job()
+    
+    async def get(self, name):
+        self.polls += 1
+        return self._job()
+    
+    async def cancel(self, name):
+        self.cancelled.append(name)
+
+
+def fallback_context():
+    """Context used when the unified response can't supply one."""
+    return AIService._fallback_enrichment("context", RAW.title)
+
+
+class TestUnifiedResponseHandling:
+    """Malformed unified responses fall back instead of failing enrichment."""
+    
+    @pytest.mark.asyncio
+    async def test_valid_payload_is_used(self):
+        result = await StubAIService(VALID_PAYLOAD).enrich_news(RAW)
+        
+        assert result.summary == "Unified summary"
+        assert result.context.wikipedia_snippet == SNIPPET
+        assert result.context.social_sentiment == "positive"
+        assert result.geo.lat == -1.29
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", NON_OBJECT_PAYLOADS)
+    async def test_non_object_payload_falls_back(self, payload):
+        result = await StubAIService(payload).enrich_news(RAW)
+        
+        assert result.summary == "Individual summary"
+        assert result.relevance_score == 0.4
+        assert result.context == fallback_context()
+        assert result.geo == Geo()
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("payload", WRONG_TYPE_PAYLOADS)
+    async def test_wrong_field_types_get_defaults(self, payload):
+        result = await StubAIService(payload).enrich_news(RAW)
+        
+        assert result.summary == "Unified summary"
+        assert isinstance(result.context.wikipedia_snippet, str)
+        assert isinstance(result.context.social_sentiment, str)
+        assert isinstance(result.context.search_trend, str)
+    
+    def test_context_from_unified_defaults_wrong_types(self):
+        context = AIService._context_from_unified({
+            "wikipedia_snippet": 12345,
+            "social_sentiment": {"x": 1},
+            "search_trend": None
+        })
+        
+        assert context.wikipedia_snippet.startswith("This article")
+        assert context.social_sentiment == "neutral"
+        assert context.search_trend == "stable"
+    
+    @pytest.mark.asyncio
+    async def test_batch_results_that_are_not_objects_count_as_failed(self):
+        service = StubAIService()
+        service.client = SimpleNamespace(aio=SimpleNamespace(batches=FakeBatches([
+            orjson.dumps(VALID_PAYLOAD).decode(),
+            '["a", "b"]',
+            orjson.dumps({**VALID_PAYLOAD, "social_sentiment": {"x": 1}}).decode()
+        ])))
+        raw_inputs = [RAW, RAW, RAW]
+        
+        with patch(
+            "swen_ai_pipeline.services.ai_service.settings",
+            settings.model_copy(update={"gemini_batch_mode": True})
+        ):
+            results = await service.batch_enrich(raw_inputs)
+        
+        assert [r.summary for r in results] == [
+            "Unified summary", "Individual summary", "Unified summary"
+        ]
+        assert results[1].context == fallback_context()
+        assert results[2].context.social_sentiment == "neutral"
+
+
+class TestBatchEnrichTimeout:
+    """Gemini batch jobs that don't finish in time."""
+    
+    @pytest.mark.asyncio
+    async def test_pending_job_is_cancelled_and_articles_enriched_individually(self):
+        service = StubAIService(VALID_PAYLOAD)
+        batches = FakeBatches([], state=types.JobState.JOB_STATE_PENDING)
+        service.client = SimpleNamespace(aio=SimpleNamespace(batches=batches))
+        
+        with patch(
+            "swen_ai_pipeline.services.ai_service.settings",
+            settings.model_copy(update={
+                "gemini_batch_mode": True,
+                "gemini_batch_timeout": 0.05,
+                "gemini_batch_poll_interval": 0.01
+            })
+        ):
+            results = await asyncio.wait_for(service.batch_enrich([RAW, RAW]), timeout=1)
+        
+        assert batches.cancelled == ["batches/test"]
+        assert batches.polls >= 1
+        assert [r.summary for r in results] == ["Unified summary", "Unified summary"]
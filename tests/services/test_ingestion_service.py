@@ -0,0 +1,186 @@
+"""
+Tests for batch ingestion in IngestionService.
+
+The AI service and repository are replaced with small async stubs, so these
+tests cover the orchestration only: concurrency, ordering, the shared
+timestamp, Gemini batch mode and error reporting.
+"""
+import asyncio
+import logging
+from types import SimpleNamespace
+from typing import List
+from unittest.mock import patch
+
+import pytest
+
+from swen_ai_pipeline.models.data_models import (
+    RawNewsInput,
+    EnrichedNewsMedia,
+    EnrichedNewsContext,
+    Geo
+)
+from swen_ai_pipeline.services.ai_service import EnrichedData
+from swen_ai_pipeline.services.ingestion_service import IngestionService
+
+
+ENRICH_ERROR = RuntimeError("enrichment failed")
+
+
+def make_raw(i: int) -> RawNewsInput:
+    """Build a raw article numbered i."""
+    return RawNewsInput(
+        title=f"Article {i}",
+        body=f"Body of article {i}",
+        source_url=f"https://example.com/{i}"
+    )
+
+
+def make_enriched(title: str) -> EnrichedData:
+    """Build enrichment whose summary records the article it was made for."""
+    return EnrichedData(
+        summary=f"Summary of {title}",
+        tags=["africa", "news", "test"],
+        relevance_score=0.5,
+        media=EnrichedNewsMedia(),
+        context=EnrichedNewsContext(),
+        geo=Geo()
+    )
+
+
+class StubAIService:
+    """Enriches articles after a short delay and records how many overlap."""
+    
+    def __init__(self, fail_title: str | None = None):
+        self.fail_title = fail_title
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.enrich_calls = 0
+        self.batch_calls: List[List[RawNewsInput]] = []
+    
+    async def enrich_news(self, raw_input: RawNewsInput) -> EnrichedData:
+        self.enrich_calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later articles finish first, so ordering comes from the inputs
+            await asyncio.sleep(0.01 / (1 + int(raw_input.title.split()[-1])))
+            if raw_input.title == self.fail_title:
+                raise ENRICH_ERROR
+            return make_enriched(raw_input.title)
+        finally:
+            self.in_flight -= 1
+    
+    async def batch_enrich(self, raw_inputs: List[RawNewsInput]) -> List[EnrichedData]:
+        self.batch_calls.append(raw_inputs)
+        return [make_enriched(raw.title) for raw in raw_inputs]
+
+
+class StubRepository:
+    """Records the articles passed to save_news_bulk."""
+    
+    def __init__(self):
+        self.saved: List[list] = []
+    
+    async def save_news_bulk(self, items):
+        self.saved.append(list(items))
+        return items
+
+
+def make_service(ai_service: StubAIService) -> IngestionService:
+    """Build an IngestionService over the stubs."""
+    with patch(
+        "swen_ai_pipeline.services.ingestion_service.get_ai_service",
+        return_value=ai_service
+    ):
+        service = IngestionService(db_session=None)
+    service.repository = StubRepository()
+    return service
+
+
+def batch_settings(batch_mode: bool = False, concurrency: int = 3) -> SimpleNamespace:
+    """Settings read by ingest_news_batch."""
+    return SimpleNamespace(gemini_batch_mode=batch_mode, ingest_batch_concurrency=concurrency)
+
+
+class TestIngestNewsBatch:
+    """Test cases for IngestionService.ingest_news_batch()."""
+    
+    @pytest.mark.asyncio
+    async def test_outputs_follow_input_order(self):
+        ai_service = StubAIService()
+        service = make_service(ai_service)
+        raw_inputs = [make_raw(i) for i in range(5)]
+        
+        with patch("swen_ai_pipeline.services.ingestion_service.settings", batch_settings()):
+            outputs = await service.ingest_news_batch(raw_inputs)
+        
+        assert [news.title for news in outputs] == [raw.title for raw in raw_inputs]
+        assert [news.summary for news in outputs] == [f"Summary of {raw.title}" for raw in raw_inputs]
+        assert service.repository.saved == [outputs]
+    
+    @pytest.mark.asyncio
+    async def test_batch_shares_one_ingestion_timestamp(self):
+        service = make_service(StubAIService())
+        
+        with patch("swen_ai_pipeline.services.ingestion_service.settings", batch_settings()):
+            outputs = await service.ingest_news_batch([make_raw(i) for i in range(4)])
+        
+        assert len({news.ingested_at for news in outputs}) == 1
+        assert outputs[0].ingested_at.tzinfo is not None
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("concurrency", [1, 3])
+    async def test_enrichment_concurrency_is_bounded(self, concurrency):
+        ai_service = StubAIService()
+        service = make_service(ai_service)
+        
+        with patch(
+            "swen_ai_pipeline.services.ingestion_service.settings",
+            batch_settings(concurrency=concurrency)
+        ):
+            await service.ingest_news_batch([make_raw(i) for i in range(8)])
+        
+        assert ai_service.enrich_calls == 8
+        assert ai_service.max_in_flight == concurrency
+    
+    @pytest.mark.asyncio
+    async def test_explicit_concurrency_overrides_settings(self):
+        ai_service = StubAIService()
+        service = make_service(ai_service)
+        
+        with patch("swen_ai_pipeline.services.ingestion_service.settings", batch_settings()):
+            await service.ingest_news_batch([make_raw(i) for i in range(6)], concurrency=2)
+        
+        assert ai_service.max_in_flight == 2
+    
+    @pytest.mark.asyncio
+    async def test_gemini_batch_mode_enriches_in_one_job(self):
+        ai_service = StubAIService()
+        service = make_service(ai_service)
+        raw_inputs = [make_raw(i) for i in range(3)]
+        
+        with patch(
+            "swen_ai_pipeline.services.ingestion_service.settings",
+            batch_settings(batch_mode=True)
+        ):
+            outputs = await service.ingest_news_batch(raw_inputs)
+        
+        assert ai_service.batch_calls == [raw_inputs]
+        assert ai_service.enrich_calls == 0
+        assert [news.title for news in outputs] == [raw.title for raw in raw_inputs]
+        assert service.repository.saved == [outputs]
+    
+    @pytest.mark.asyncio
+    async def test_failed_enrichment_is_logged_and_chained(self, caplog):
+        service = make_service(StubAIService(fail_title="Article 2"))
+        
+        with patch("swen_ai_pipeline.services.ingestion_service.settings", batch_settings()):
+            with caplog.at_level(logging.ERROR, logger="swen.ingestion_service"):
+                with pytest.raises(Exception, match="Batch news ingestion failed") as excinfo:
+                    await service.ingest_news_batch([make_raw(i) for i in range(4)])
+        
+        cause = excinfo.value.__cause__
+        assert isinstance(cause, ExceptionGroup)
+        assert cause.exceptions == (ENRICH_ERROR,)
+        assert service.repository.saved == []
+        assert caplog.records[-1].exc_info is not None